@@ -135,6 +135,7 @@ class ConverterGUI(QMainWindow, LoadingSystemMixin):
         self.progress_bar = None
         self.progress_label = None
         self.playlist_info = None
+        self._options_dialog = None
         
         # Setup application
         self.setWindowTitle(f"{self.app_config.APP_NAME} v{self.app_config.VERSION}")
@@ -1048,10 +1049,14 @@ class ConverterGUI(QMainWindow, LoadingSystemMixin):
     
     def _show_options_dialog(self):
         """Show options dialog."""
-        dialog = OptionsDialog(self.app_config, self.settings, self)
-        dialog.settings_changed.connect(self._on_settings_changed)
+        dialog = self._options_dialog
+        if dialog is None:
+            dialog = self._options_dialog = OptionsDialog(self.app_config, self.settings, self)
+            dialog.settings_changed.connect(self._on_settings_changed)
+        else:
+            dialog.refresh(self.settings)
         if dialog.exec():
-            self.settings = dialog.get_settings()
+            self.settings.update(dialog.get_settings())
             self._save_configuration()
     
     def _on_settings_changed(self, new_settings):
@@ -1166,20 +1171,22 @@ def main():
         # Connect logs to GUI after window creation
         log_dialog = LogDialog(window.app_config, window)
         
+        window.log_handler.set_log_dialog(log_dialog)
+        
         class GuiLogHandler(logging.Handler):
-            def __init__(self, log_dialog):
+            # Records can come from ConversionThread, so go through the
+            # queued LogHandler signal rather than touching the dialog here
+            def __init__(self, log_handler):
                 super().__init__()
-                self.log_dialog = log_dialog
+                self.log_handler = log_handler
             
             def emit(self, record):
-                if self.log_dialog:
-                    msg = self.format(record)
-                    self.log_dialog.append_log(msg, record.levelname)
+                msg = self.format(record)
+                self.log_handler.log_message(msg, record.levelname)
         
-        gui_handler = GuiLogHandler(log_dialog)
+        gui_handler = GuiLogHandler(window.log_handler)
         gui_handler.setLevel(logging.DEBUG)
         logging.getLogger().addHandler(gui_handler)
-        window.log_handler.set_log_dialog(log_dialog)
         
         window.show()
         
@@ -1659,10 +1666,14 @@ if __name__ == "__main__":
     
     def _show_options_dialog(self):
         """Show options dialog."""
-        dialog = OptionsDialog(self.app_config, self.settings, self)
-        dialog.settings_changed.connect(self._on_settings_changed)
+        dialog = self._options_dialog
+        if dialog is None:
+            dialog = self._options_dialog = OptionsDialog(self.app_config, self.settings, self)
+            dialog.settings_changed.connect(self._on_settings_changed)
+        else:
+            dialog.refresh(self.settings)
         if dialog.exec():
-            self.settings = dialog.get_settings()
+            self.settings.update(dialog.get_settings())
             self._save_configuration()
     
     def _on_settings_changed(self, new_settings):
@@ -1780,20 +1791,22 @@ def main():
         # Connect logs to GUI after window creation
         log_dialog = LogDialog(window.app_config, window)
         
+        window.log_handler.set_log_dialog(log_dialog)
+        
         class GuiLogHandler(logging.Handler):
-            def __init__(self, log_dialog):
+            # Records can come from ConversionThread, so go through the
+            # queued LogHandler signal rather than touching the dialog here
+            def __init__(self, log_handler):
                 super().__init__()
-                self.log_dialog = log_dialog
+                self.log_handler = log_handler
             
             def emit(self, record):
-                if self.log_dialog:
-                    msg = self.format(record)
-                    self.log_dialog.append_log(msg, record.levelname)
+                msg = self.format(record)
+                self.log_handler.log_message(msg, record.levelname)
         
-        gui_handler = GuiLogHandler(log_dialog)
+        gui_handler = GuiLogHandler(window.log_handler)
         gui_handler.setLevel(logging.DEBUG)
         logging.getLogger().addHandler(gui_handler)
-        window.log_handler.set_log_dialog(log_dialog)
         
         window.show()
         
@@ -4,10 +4,244 @@ Enhanced playlist view with track information and playback functionality
 """
 
 import os
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtWidgets import *
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QKeyEvent, QBrush, QFont
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractTableModel, QModelIndex, QItemSelectionModel
+from PySide6.QtGui import QColor, QKeyEvent, QBrush, QFont, QActionGroup
+
+from utils.playlist import CueType
+
+# Qt enum values bound once for the per-cell and per-event hot paths
+_DISPLAY_ROLE = int(Qt.ItemDataRole.DisplayRole)
+_FOREGROUND_ROLE = int(Qt.ItemDataRole.ForegroundRole)
+_USER_ROLE = int(Qt.ItemDataRole.UserRole)
+_ASCENDING = Qt.SortOrder.AscendingOrder
+_DESCENDING = Qt.SortOrder.DescendingOrder
+_KEY_P = int(Qt.Key.Key_P)
+
+
+class TracksModel(QAbstractTableModel):
+    """Table model exposing playlist tracks to the details view.
+    
+    Cell text is computed on demand from the track objects, so sorting,
+    filtering and playback changes never rebuild per-row widgets.
+    """
+    
+    COLUMNS = ['▶', '#', 'Artist', 'Title', 'Key', 'BPM', 'Gain', 'Grid', 'Duration', 'Cues', 'Album']
+    
+    # Cue type values used by the cue summary
+    _HOT = CueType.HOT_CUE.value
+    _LOAD = CueType.LOAD.value
+    _LOOP = CueType.LOOP.value
+    
+    def __init__(self, tracks: List, key_translator, key_format: str, parent=None):
+        super().__init__(parent)
+        self.key_translator = key_translator
+        self.key_format = key_format
+        self.play_icon = "▶"
+        self.pause_icon = "⏸"
+        
+        self._tracks = list(tracks)  # Filtered tracks in playlist order
+        self._rows = list(tracks)    # Tracks in display order
+        self._row_by_id = {id(track): row for row, track in enumerate(self._rows)}
+        self._sort_column = -1
+        self._sort_order = _ASCENDING
+        self._playing_id = None
+        
+        # Translated key text and foreground brush per (musical_key, key_format)
+        self._key_cache: Dict[tuple, tuple] = {}
+        
+        # Format-independent display strings per track id
+        self._disp_cache: Dict[int, tuple] = {}
+        
+        # Lowercased (artist, title, album) per track id for text sorting
+        lower_text = {id(t): (t.artist.lower(), t.title.lower(), t.album.lower()) for t in tracks}
+        
+        self._sort_keys = {
+            2: lambda t: lower_text[id(t)][0],
+            3: lambda t: lower_text[id(t)][1],
+            4: lambda t: self._xlate(t.musical_key)[0],
+            5: attrgetter('bpm'),
+            6: attrgetter('gain'),
+            7: lambda t: t.grid_anchor_ms is not None,
+            8: attrgetter('playtime'),
+            9: lambda t: len(t.cue_points),
+            10: lambda t: lower_text[id(t)][2]
+        }
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.COLUMNS[section]
+            if role == Qt.ItemDataRole.InitialSortOrderRole:
+                return _ASCENDING
+        return None
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        
+        track = self._rows[index.row()]
+        column = index.column()
+        
+        if role == _DISPLAY_ROLE:
+            return self._cell_text(track, index.row(), column)
+        if role == _FOREGROUND_ROLE and column == 4:
+            return self._xlate(track.musical_key)[1]
+        if role == _USER_ROLE and column == 0:
+            return id(track)
+        return None
+    
+    def _xlate(self, musical_key: str) -> tuple:
+        """Return cached (key text, QBrush or None) for the current format."""
+        cache_key = (musical_key, self.key_format)
+        cached = self._key_cache.get(cache_key)
+        if cached is None:
+            text = self.key_translator.translate(musical_key, self.key_format)
+            key_color = self.key_translator.get_key_color(musical_key, self.key_format)
+            cached = (text, QBrush(QColor(key_color)) if key_color else None)
+            self._key_cache[cache_key] = cached
+        return cached
+    
+    def _cell_text(self, track, row: int, column: int) -> str:
+        """Compute display text for a single cell."""
+        if column == 0:
+            return self.pause_icon if id(track) == self._playing_id else self.play_icon
+        if column == 1:
+            return str(row + 1)
+        if column == 2:
+            return track.artist
+        if column == 3:
+            return track.title
+        if column == 4:
+            return self._xlate(track.musical_key)[0]
+        if 5 <= column <= 9:
+            return self._display_values(track)[column - 5]
+        return track.album
+    
+    def _display_values(self, track) -> tuple:
+        """Return cached (bpm, gain, grid, duration, cues) strings for a track."""
+        track_id = id(track)
+        cached = self._disp_cache.get(track_id)
+        if cached is None:
+            cached = (
+                f"{track.bpm:.2f}" if track.bpm else "",
+                f"{track.gain:+.2f}" if track.gain else "",
+                "✓" if track.grid_anchor_ms is not None else "",
+                f"{int(track.playtime // 60):02d}:{int(track.playtime % 60):02d}",
+                self._get_cue_summary(track.cue_points)
+            )
+            self._disp_cache[track_id] = cached
+        return cached
+    
+    def _get_cue_summary(self, cue_points: List[Dict]) -> str:
+        """Generate cue point summary."""
+        hot_type, load_type, loop_type = self._HOT, self._LOAD, self._LOOP
+        hotcues = memory = loops = 0
+        
+        for cue in cue_points:
+            cue_type = cue.get('type')
+            if cue_type == hot_type and cue.get('hotcue', -1) > 0:
+                hotcues += 1
+            elif cue_type == load_type:
+                memory += 1
+            elif cue_type == loop_type and cue.get('len', 0) > 0:
+                loops += 1
+        
+        summary = " ".join(part for part in (
+            f"H{hotcues}" if hotcues else "",
+            f"M{memory}" if memory else "",
+            f"L{loops}" if loops else ""
+        ) if part)
+        return summary or "-"
+    
+    def key_text(self, musical_key: str) -> str:
+        """Return the displayed key text for the current format."""
+        return self._xlate(musical_key)[0]
+    
+    def duration_text(self, track) -> str:
+        """Return the displayed mm:ss duration of a track."""
+        return self._display_values(track)[3]
+    
+    def track_at(self, row: int):
+        """Return the track displayed at row, or None."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+    
+    def row_of(self, track_id) -> int:
+        """Return the display row of a track id, or -1 if not shown."""
+        return self._row_by_id.get(track_id, -1)
+    
+    def sort_state(self) -> Tuple[int, Qt.SortOrder]:
+        """Return the current (column, order) sort, column -1 if unsorted."""
+        return self._sort_column, self._sort_order
+    
+    def set_tracks(self, tracks: List):
+        """Replace the displayed tracks, keeping the current sort."""
+        self.beginResetModel()
+        self._tracks = list(tracks)
+        self._apply_sort()
+        self.endResetModel()
+    
+    def set_key_format(self, key_format: str):
+        """Switch key notation and refresh the key column."""
+        self.key_format = key_format
+        self._key_cache.clear()
+        if self._sort_column == 4:
+            self.sort(self._sort_column, self._sort_order)
+        elif self._rows:
+            self.dataChanged.emit(self.index(0, 4), self.index(len(self._rows) - 1, 4))
+    
+    def set_playing(self, track_id):
+        """Mark track_id as playing (None for stopped) and refresh icons."""
+        previous_id, self._playing_id = self._playing_id, track_id
+        for changed_id in (previous_id, track_id):
+            row = self._row_by_id.get(changed_id, -1)
+            if row >= 0:
+                index = self.index(row, 0)
+                self.dataChanged.emit(index, index)
+    
+    def sort(self, column: int, order=_ASCENDING):
+        """Sort displayed rows in place, preserving persistent indexes."""
+        if column == 0:  # Play column is not sortable
+            return
+        
+        self._sort_column = column
+        self._sort_order = order
+        
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_tracks = [self._rows[index.row()] for index in old_indexes]
+        
+        self._apply_sort()
+        
+        new_indexes = [self.index(self._row_by_id[id(track)], index.column())
+                       for track, index in zip(old_tracks, old_indexes)]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    def _apply_sort(self):
+        """Rebuild display order from the filtered tracks."""
+        descending = self._sort_order == _DESCENDING
+        
+        # Rows are never mutated in place, so playlist order is shared as-is
+        if self._sort_column == 1:  # Number column
+            rows = self._tracks[::-1] if descending else self._tracks
+        elif self._sort_column in self._sort_keys:
+            rows = sorted(self._tracks, key=self._sort_keys[self._sort_column], reverse=descending)
+        else:
+            rows = self._tracks
+        
+        self._rows = rows
+        self._row_by_id = {id(track): row for row, track in enumerate(rows)}
 
 
 class DetailWindow(QDialog):
@@ -20,6 +254,7 @@ class DetailWindow(QDialog):
         self.audio_manager = audio_manager
         self.selected_track_id = None
         self.key_format = "Open Key"
+        self._populating = False
         
         self.setWindowTitle(f"Details: {playlist.name}")
         self.resize(1200, 600)
@@ -29,12 +264,21 @@ class DetailWindow(QDialog):
         # Track lookup for performance
         self.tracks_by_id = {id(track): track for track in playlist.tracks}
         
+        # Lowercased "artist\0title\0album" per track for the search filter
+        self._search_index = [(track, f"{track.artist}\0{track.title}\0{track.album}".lower())
+                              for track in playlist.tracks]
+        
+        # Last search query and its matches, reused when the query grows
+        self._last_query = ""
+        self._last_result = self._search_index
+        
         # Play/pause icons
         self.play_icon = "▶"
         self.pause_icon = "⏸"
         
         self._setup_ui()
         self._populate_table()
+        self._apply_playback_state()
         self._setup_shortcuts()
     
     def _setup_ui(self):
@@ -57,16 +301,26 @@ class DetailWindow(QDialog):
         search_label = QLabel("Search:")
         self.search_field = QLineEdit()
         self.search_field.setPlaceholderText("Filter tracks...")
-        self.search_field.textChanged.connect(self._filter_tracks)
+        
+        # Debounce filtering so typing does not refilter on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._filter_tracks)
+        self.search_field.textChanged.connect(self._filter_timer.start)
         
         # Key format selector
         key_label = QLabel("Key Format:")
         self.key_format_button = QPushButton(self.key_format)
         
         key_menu = QMenu(self)
+        key_group = QActionGroup(self)
         for fmt in self.key_translator.get_supported_formats():
             action = key_menu.addAction(fmt)
-            action.triggered.connect(lambda checked, f=fmt: self._change_key_format(f))
+            action.setCheckable(True)
+            action.setChecked(fmt == self.key_format)
+            key_group.addAction(action)
+        key_group.triggered.connect(self._on_key_format_triggered)
         self.key_format_button.setMenu(key_menu)
         
         header_layout.addWidget(playlist_label)
@@ -84,14 +338,18 @@ class DetailWindow(QDialog):
         layout.addWidget(info_label)
         
         # Tracks table
-        self.tracks_table = QTreeWidget()
+        self.tracks_model = TracksModel(self.playlist.tracks, self.key_translator, self.key_format, self)
+        self.tracks_model.play_icon = self.play_icon
+        self.tracks_model.pause_icon = self.pause_icon
+        
+        self.tracks_table = QTreeView()
+        self.tracks_table.setModel(self.tracks_model)
         self.tracks_table.setAlternatingRowColors(True)
-        self.tracks_table.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.tracks_table.setSelectionMode(QTreeView.SelectionMode.SingleSelection)
         self.tracks_table.setRootIsDecorated(False)
+        self.tracks_table.setUniformRowHeights(True)
         
-        columns = ['▶', '#', 'Artist', 'Title', 'Key', 'BPM', 'Gain', 'Grid', 'Duration', 'Cues', 'Album']
-        self.tracks_table.setColumnCount(len(columns))
-        self.tracks_table.setHeaderLabels(columns)
+        columns = TracksModel.COLUMNS
         
         # Column widths
         widths = {'▶': 30, '#': 40, 'Artist': 200, 'Title': 280, 'Key': 60, 
@@ -101,13 +359,15 @@ class DetailWindow(QDialog):
             self.tracks_table.setColumnWidth(i, widths.get(col, 100))
         
         # Connect signals
-        self.tracks_table.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.tracks_table.itemClicked.connect(self._on_item_clicked)
-        self.tracks_table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.tracks_table.header().sectionClicked.connect(self._on_header_clicked)
+        self.tracks_table.doubleClicked.connect(self._on_item_double_clicked)
+        self.tracks_table.clicked.connect(self._on_item_clicked)
+        self.tracks_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
-        self.sort_column = -1
-        self.sort_order = Qt.SortOrder.AscendingOrder
+        # Sorting is delegated to the view; start in playlist order
+        header = self.tracks_table.header()
+        header.setSortIndicator(-1, _ASCENDING)
+        self.tracks_table.setSortingEnabled(True)
+        header.sortIndicatorChanged.connect(self._on_sort_indicator_changed)
         
         layout.addWidget(self.tracks_table)
         
@@ -149,185 +409,114 @@ class DetailWindow(QDialog):
             self.audio_manager.stop()
         self.accept()    
     
+    def _on_key_format_triggered(self, action):
+        """Dispatch key format menu selection."""
+        self._change_key_format(action.text())
+    
     def _change_key_format(self, format_name: str):
         """Change key display format."""
         self.key_format = format_name
         self.key_format_button.setText(format_name)
-        self._populate_table()
+        self.tracks_model.set_key_format(format_name)
     
     def _populate_table(self):
         """Populate table with track data."""
-        if self.sort_column == -1:
-            self._populate_table_with_tracks(self.playlist.tracks)
-        else:
-            tracks_to_sort = list(self.playlist.tracks)
-            
-            sort_keys = {
-                2: lambda t: t.artist.lower(),
-                3: lambda t: t.title.lower(),
-                4: lambda t: self.key_translator.translate(t.musical_key, self.key_format),
-                5: lambda t: t.bpm,
-                6: lambda t: t.gain,
-                7: lambda t: 1 if t.grid_anchor_ms is not None else 0,
-                8: lambda t: t.playtime,
-                9: lambda t: len(t.cue_points),
-                10: lambda t: t.album.lower()
-            }
-            
-            if self.sort_column == 1:  # Number column
-                if self.sort_order == Qt.SortOrder.DescendingOrder:
-                    tracks_to_sort.reverse()
-            elif self.sort_column in sort_keys:
-                tracks_to_sort.sort(key=sort_keys[self.sort_column],
-                                  reverse=(self.sort_order == Qt.SortOrder.DescendingOrder))
-            
-            self._populate_table_with_tracks(tracks_to_sort)
+        self._populate_table_with_tracks(self.playlist.tracks)
     
     def _populate_table_with_tracks(self, tracks: List):
         """Populate table with provided track list."""
+        # Repaint once after the reset and reselection
+        self.tracks_table.setUpdatesEnabled(False)
+        self._populating = True
+        try:
+            self.tracks_model.set_tracks(tracks)
+            
+            if self.selected_track_id:
+                row = self.tracks_model.row_of(self.selected_track_id)
+                if row >= 0:
+                    index = self.tracks_model.index(row, 0)
+                    self.tracks_table.selectionModel().select(
+                        index, QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows)
+                    self.tracks_table.setCurrentIndex(index)
+        finally:
+            self._populating = False
+            self.tracks_table.setUpdatesEnabled(True)
+    
+    def _apply_playback_state(self):
+        """Sync play icons and the play button with the audio manager."""
         current_state = self.audio_manager.get_current_state() if self.audio_manager else {}
         currently_playing_id = current_state.get('item_id')
         is_playing = current_state.get('is_playing', False)
         
-        selected_track_id = self.selected_track_id
-        
-        self.tracks_table.blockSignals(True)
-        self.tracks_table.clear()
-        
-        item_to_reselect = None
-        
-        for i, track in enumerate(tracks, 1):
-            item = QTreeWidgetItem()
-            track_id = id(track)
-            
-            # Calculate display values
-            duration = f"{int(track.playtime // 60):02d}:{int(track.playtime % 60):02d}"
-            key = self.key_translator.translate(track.musical_key, self.key_format)
-            gain = f"{track.gain:+.2f}" if track.gain else ""
-            grid_marker = "✓" if track.grid_anchor_ms is not None else ""
-            cue_summary = self._get_cue_summary(track.cue_points)
-            
-            play_icon = self.pause_icon if is_playing and track_id == currently_playing_id else self.play_icon
-            
-            # Set item data
-            item.setText(0, play_icon)
-            item.setText(1, str(i))
-            item.setText(2, track.artist)
-            item.setText(3, track.title)
-            item.setText(4, key)
-            item.setText(5, f"{track.bpm:.2f}" if track.bpm else "")
-            item.setText(6, gain)
-            item.setText(7, grid_marker)
-            item.setText(8, duration)
-            item.setText(9, cue_summary)
-            item.setText(10, track.album)
-            
-            # Set key color
-            key_color = self.key_translator.get_key_color(track.musical_key, self.key_format)
-            if key_color:
-                item.setForeground(4, QColor(key_color))
-            
-            item.setData(0, Qt.ItemDataRole.UserRole, track_id)
-            
-            if selected_track_id and track_id == selected_track_id:
-                item_to_reselect = item
-                
-            self.tracks_table.addTopLevelItem(item)
-        
-        # Update play button state
         if is_playing and currently_playing_id:
+            self.tracks_model.set_playing(currently_playing_id)
             self.play_button.setText("Stop Playback")
         else:
+            self.tracks_model.set_playing(None)
             self.play_button.setText("Play Selected")
-        
-        self.tracks_table.blockSignals(False)
-        
-        if item_to_reselect:
-            self.tracks_table.clearSelection()
-            item_to_reselect.setSelected(True)
-            self.tracks_table.setCurrentItem(item_to_reselect)
     
     def _filter_tracks(self):
         """Filter tracks based on search text."""
         search_text = self.search_field.text().lower()
         
         if not search_text:
+            self._last_query = ""
+            self._last_result = self._search_index
             self._populate_table()
             return
         
-        filtered_tracks = [
-            t for t in self.playlist.tracks
-            if (search_text in t.artist.lower() or
-                search_text in t.title.lower() or
-                search_text in t.album.lower())
-        ]
-        
-        self._populate_table_with_tracks(filtered_tracks)
-    
-    def _get_cue_summary(self, cue_points: List[Dict]) -> str:
-        """Generate cue point summary."""
-        from utils.playlist import CueType
+        # A longer query can only match a subset of the previous matches
+        candidates = self._last_result if search_text.startswith(self._last_query) else self._search_index
         
-        summary = {'hotcues': 0, 'memory': 0, 'loops': 0}
+        matches = [entry for entry in candidates if search_text in entry[1]]
         
-        for cue in cue_points:
-            if cue.get('type') == CueType.HOT_CUE.value and cue.get('hotcue', -1) > 0:
-                summary['hotcues'] += 1
-            elif cue.get('type') == CueType.LOAD.value:
-                summary['memory'] += 1
-            elif cue.get('type') == CueType.LOOP.value and cue.get('len', 0) > 0:
-                summary['loops'] += 1
-        
-        parts = []
-        if summary['hotcues'] > 0: parts.append(f"H{summary['hotcues']}")
-        if summary['memory'] > 0: parts.append(f"M{summary['memory']}")
-        if summary['loops'] > 0: parts.append(f"L{summary['loops']}")
-        return " ".join(parts) if parts else "-"
-    
-    def _on_header_clicked(self, column_index: int):
-        """Handle column header click for sorting."""
+        self._last_query = search_text
+        self._last_result = matches
+        self._populate_table_with_tracks([track for track, _ in matches])
+    
+    def _on_sort_indicator_changed(self, column_index: int, order):
+        """Keep the play column out of sorting."""
         if column_index == 0:
-            return
-            
-        if column_index == self.sort_column:
-            self.sort_order = Qt.SortOrder.DescendingOrder if self.sort_order == Qt.SortOrder.AscendingOrder else Qt.SortOrder.AscendingOrder
-        else:
-            self.sort_column = column_index
-            self.sort_order = Qt.SortOrder.AscendingOrder
-        
-        self.tracks_table.header().setSortIndicator(column_index, self.sort_order)
-        self._populate_table()
+            header = self.tracks_table.header()
+            header.blockSignals(True)
+            header.setSortIndicator(*self.tracks_model.sort_state())
+            header.blockSignals(False)
+    
+    def _selected_index(self) -> Optional[QModelIndex]:
+        """Return the column-0 index of the selected row, or None."""
+        selected_rows = self.tracks_table.selectionModel().selectedRows(0)
+        return selected_rows[0] if selected_rows else None
     
-    def _on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle item clicks."""
-        if column == 0:  # Play button
-            track_id = item.data(0, Qt.ItemDataRole.UserRole)
-            self._toggle_playback(item, track_id)
+        if index.column() == 0:  # Play button
+            track_id = index.data(_USER_ROLE)
+            self._toggle_playback(track_id)
     
-    def _on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """Handle double-clicks."""
-        if column == 9:  # Cues column
-            self._show_cue_timeline(item)
+        if index.column() == 9:  # Cues column
+            self._show_cue_timeline(index.siblingAtColumn(0))
     
     def _on_selection_changed(self):
         """Handle selection changes."""
-        selected_items = self.tracks_table.selectedItems()
-        if selected_items:
-            self.selected_track_id = selected_items[0].data(0, Qt.ItemDataRole.UserRole)
+        if self._populating:
+            return
+        
+        index = self._selected_index()
+        if index:
+            self.selected_track_id = index.data(_USER_ROLE)
             self.setFocus()
     
-    def _show_cue_timeline(self, item: QTreeWidgetItem):
+    def _show_cue_timeline(self, index: QModelIndex):
         """Show cue timeline for track."""
-        track_id = item.data(0, Qt.ItemDataRole.UserRole)
-        if track_id:
-            for track in self.playlist.tracks:
-                if id(track) == track_id:
-                    from ui.timeline import TimelineDialog
-                    dialog = TimelineDialog(track, self.key_translator, self)
-                    dialog.exec()
-                    break
-    
-    def _toggle_playback(self, item: QTreeWidgetItem, track_id):
+        track = self.tracks_by_id.get(index.data(_USER_ROLE))
+        if track:
+            from ui.timeline import TimelineDialog
+            dialog = TimelineDialog(track, self.key_translator, self)
+            dialog.exec()
+    
+    def _toggle_playback(self, track_id):
         """Toggle audio playback for track."""
         if not self.audio_manager or not track_id:
             return
@@ -336,67 +525,55 @@ class DetailWindow(QDialog):
         
         if current_state['is_playing']:
             self.audio_manager.stop()
-            self.play_button.setText("Play Selected")
-            
-            # Update all play buttons
-            for i in range(self.tracks_table.topLevelItemCount()):
-                curr_item = self.tracks_table.topLevelItem(i)
-                if curr_item.data(0, Qt.ItemDataRole.UserRole) == current_state['item_id']:
-                    curr_item.setText(0, self.play_icon)
-                    break
             
             if current_state['item_id'] == track_id:
+                self._apply_playback_state()
                 return
         
-        for track in self.playlist.tracks:
-            if id(track) == track_id:
-                if track.file_path and os.path.exists(track.file_path):
-                    if self.audio_manager.play_file(track.file_path, track_id):
-                        item.setText(0, self.pause_icon)
-                        self.play_button.setText("Stop Playback")
-                    else:
-                        QMessageBox.warning(self, "File Not Found",
-                                          "The audio file for this track could not be found.")
-                break
+        track = self.tracks_by_id.get(track_id)
+        if track and track.file_path and os.path.exists(track.file_path):
+            if not self.audio_manager.play_file(track.file_path, track_id):
+                QMessageBox.warning(self, "File Not Found",
+                                  "The audio file for this track could not be found.")
+        
+        self._apply_playback_state()
     
     def _play_selected_track(self):
         """Play currently selected track."""
-        selected_items = self.tracks_table.selectedItems()
-        if selected_items:
-            item = selected_items[0]
-            track_id = item.data(0, Qt.ItemDataRole.UserRole)
+        index = self._selected_index()
+        if index:
+            track_id = index.data(_USER_ROLE)
             if track_id:
-                self._toggle_playback(item, track_id)
+                self._toggle_playback(track_id)
     
     def _copy_track_info(self):
         """Copy selected track info to clipboard."""
-        selected_items = self.tracks_table.selectedItems()
-        if not selected_items:
+        index = self._selected_index()
+        if not index:
             QMessageBox.information(self, "No Selection", "Please select a track first.")
             return
             
-        item = selected_items[0]
-        track_id = item.data(0, Qt.ItemDataRole.UserRole)
-        
-        for track in self.playlist.tracks:
-            if id(track) == track_id:
-                info = f"""Track Information:
-Artist: {track.artist}
-Title: {track.title}
-Album: {track.album}
-BPM: {track.bpm:.2f}
-Key: {self.key_translator.translate(track.musical_key, self.key_format)}
-Duration: {int(track.playtime // 60):02d}:{int(track.playtime % 60):02d}
-File: {track.file_path}
-Cue Points: {len(track.cue_points)}"""
-                
-                QApplication.clipboard().setText(info)
-                QMessageBox.information(self, "Copied", "Track information copied to clipboard.")
-                break
+        track = self.tracks_by_id.get(index.data(_USER_ROLE))
+        if track:
+            # Reuse the table's cached key and duration strings
+            info = "\n".join([
+                "Track Information:",
+                "Artist: " + track.artist,
+                "Title: " + track.title,
+                "Album: " + track.album,
+                f"BPM: {track.bpm:.2f}",
+                "Key: " + self.tracks_model.key_text(track.musical_key),
+                "Duration: " + self.tracks_model.duration_text(track),
+                "File: " + track.file_path,
+                f"Cue Points: {len(track.cue_points)}"
+            ])
+            
+            QApplication.clipboard().setText(info)
+            QMessageBox.information(self, "Copied", "Track information copied to clipboard.")
     
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard shortcuts."""
-        if event.key() == Qt.Key.Key_P:
+        if event.key() == _KEY_P:
             self._play_selected_track()
             event.accept()
         else:
@@ -5,13 +5,22 @@ Displays conversion logs and application messages
 
 from datetime import datetime
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton, QFrame, QApplication
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeyEvent
+from PySide6.QtCore import Qt, QObject, Signal
+from PySide6.QtGui import QKeyEvent, QColor, QTextCharFormat, QTextCursor
 
 
 class LogDialog(QDialog):
     """Dialog for displaying and managing log messages."""
     
+    # Level colors for log lines
+    LEVEL_COLORS = {
+        'DEBUG': '#adb5bd',
+        'INFO': '#f8f9fa',
+        'WARNING': '#ffc107',
+        'ERROR': '#dc3545',
+        'CRITICAL': '#dc3545'
+    }
+    
     def __init__(self, app_config, parent=None):
         super().__init__(parent)
         self.app_config = app_config
@@ -46,6 +55,13 @@ class LogDialog(QDialog):
             }}
         """)
         
+        # Character format per level, reused for every appended line
+        self._level_formats = {}
+        for level, color in self.LEVEL_COLORS.items():
+            text_format = QTextCharFormat()
+            text_format.setForeground(QColor(color))
+            self._level_formats[level] = text_format
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -97,19 +113,14 @@ class LogDialog(QDialog):
         """Append message to log with timestamp and level."""
         timestamp = datetime.now().strftime('%H:%M:%S')
         
-        # Format message with level coloring
-        level_colors = {
-            'DEBUG': '#adb5bd',
-            'INFO': '#f8f9fa',
-            'WARNING': '#ffc107',
-            'ERROR': '#dc3545',
-            'CRITICAL': '#dc3545'
-        }
-        
-        color = level_colors.get(level.upper(), '#f8f9fa')
-        formatted_message = f'<span style="color: {color};">[{timestamp}] {level}: {message}</span>'
-        
-        self.log_text.append(formatted_message)
+        # Insert plain text with level coloring, no HTML parsing
+        text_format = self._level_formats.get(level.upper(), self._level_formats['INFO'])
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not document.isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(f"[{timestamp}] {level}: {message}", text_format)
         
         # Auto-scroll to bottom
         scrollbar = self.log_text.verticalScrollBar()
@@ -149,7 +160,9 @@ class LogDialog(QDialog):
                     f.write(f"Traktor Bridge Log Export\n")
                     f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write("=" * 50 + "\n\n")
-                    f.write(self.log_text.toPlainText())
+                    for line in self.iter_log_lines():
+                        f.write(line)
+                        f.write("\n")
                 
                 self.append_log(f"Log exported to: {file_path}", "INFO")
                 
@@ -160,6 +173,13 @@ class LogDialog(QDialog):
         """Get current log content as plain text."""
         return self.log_text.toPlainText()
     
+    def iter_log_lines(self):
+        """Yield log lines one at a time without copying the whole document."""
+        block = self.log_text.document().firstBlock()
+        while block.isValid():
+            yield block.text()
+            block = block.next()
+    
     def set_log_content(self, content: str):
         """Set log content directly."""
         self.log_text.setPlainText(content)
@@ -182,25 +202,37 @@ class LogDialog(QDialog):
             super().keyPressEvent(event)
 
 
-class LogHandler:
-    """Log handler that connects to LogDialog."""
+class LogHandler(QObject):
+    """Log handler that connects to LogDialog.
     
-    def __init__(self):
+    Messages are delivered through a queued signal, so log_message can be
+    called from worker threads without touching widgets off the GUI thread.
+    """
+    
+    log_requested = Signal(str, str)  # message, level
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.log_dialog = None
     
     def set_log_dialog(self, dialog: LogDialog):
         """Set the log dialog to receive messages."""
+        if self.log_dialog:
+            self.log_requested.disconnect(self.log_dialog.append_log)
+        
         self.log_dialog = dialog
+        if dialog:
+            self.log_requested.connect(dialog.append_log, Qt.ConnectionType.QueuedConnection)
     
     def log_message(self, message: str, level: str = "INFO"):
         """Send message to log dialog if available."""
         if self.log_dialog:
-            self.log_dialog.append_log(message, level)
+            self.log_requested.emit(message, level)
     
     def show_log_window(self, parent=None, app_config=None):
         """Show or create log window."""
         if not self.log_dialog and app_config:
-            self.log_dialog = LogDialog(app_config, parent)
+            self.set_log_dialog(LogDialog(app_config, parent))
         
         if self.log_dialog:
             self.log_dialog.show()
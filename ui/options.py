@@ -4,108 +4,172 @@ Options Dialog Module for Traktor Bridge
 Dialog d'options harmonisé avec l'interface principale
 """
 
-from PySide6.QtWidgets import *
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QKeySequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QWidget, QTabWidget, QGroupBox,
+    QLabel, QPushButton, QComboBox, QCheckBox, QSpinBox, QDialogButtonBox, QMessageBox
+)
+from PySide6.QtCore import Qt, Signal, QSignalBlocker
+from PySide6.QtGui import QFont
+
+
+# Choix des listes déroulantes
+_EXPORT_FORMATS = ("CDJ/USB", "Rekordbox Database", "Rekordbox XML", "M3U")
+_KEY_FORMATS = ("Open Key", "Camelot", "Traditional", "Mixed In Key")
+_RB_VERSIONS = ("RB6", "RB7")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+# Feuille de style unique du dialogue, les labels se distinguent par leur propriété "role"
+_OPTIONS_QSS = """
+        QDialog {{
+            background-color: {bg_dark};
+            color: {fg_light};
+        }}
+        QLabel {{ 
+            color: {fg_light}; 
+        }}
+        QPushButton {{
+            background-color: {bg_med};
+            color: {fg_light};
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+        }}
+        QPushButton:hover {{ 
+            background-color: {bg_light}; 
+        }}
+        QLineEdit {{
+            background-color: {bg_med};
+            color: {fg_light};
+            border: none;
+            padding: 6px;
+            border-radius: 4px;
+        }}
+        QComboBox {{
+            background-color: {bg_med};
+            color: {fg_light};
+            border: none;
+            padding: 6px;
+            border-radius: 4px;
+        }}
+        QComboBox QAbstractItemView {{
+            background-color: {bg_med};
+            color: {fg_light};
+            selection-background-color: {accent};
+        }}
+        QCheckBox {{ 
+            color: {fg_light}; 
+        }}
+        QSpinBox {{
+            background-color: {bg_med};
+            color: {fg_light};
+            border: none;
+            padding: 6px;
+            border-radius: 4px;
+        }}
+        QTabWidget::pane {{
+            border: none;
+            background-color: {bg_dark};
+        }}
+        QTabBar::tab {{
+            background-color: {bg_med};
+            color: {fg_light};
+            border: none;
+            padding: 8px 16px;
+            margin-right: 2px;
+            border-radius: 4px 4px 0px 0px;
+        }}
+        QTabBar::tab:selected {{
+            background-color: {accent};
+        }}
+        QTabBar::tab:hover {{
+            background-color: {bg_light};
+        }}
+        QGroupBox {{
+            font-weight: bold;
+            color: {accent};
+            border: 1px solid {bg_light};
+            border-radius: 4px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }}
+        QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+        }}
+        QLabel[role="title"] {{
+            font-size: 16pt;
+            font-weight: bold;
+        }}
+        QLabel[role="subtitle"] {{
+            color: {fg_muted};
+        }}
+        QLabel[role="help"] {{
+            color: {fg_muted};
+        }}
+        QLabel[role="target"] {{
+            font-weight: bold;
+            font-size: 12pt;
+        }}
+"""
+
+
+@lru_cache(maxsize=1)
+def _options_qss(colors: tuple) -> str:
+    """Return the dialog stylesheet for a (name, color) tuple, formatted once."""
+    return _OPTIONS_QSS.format(**dict(colors))
 
 
 class OptionsDialog(QDialog):
     """Dialog d'options avec design harmonisé à l'interface principale."""
     
-    settings_changed = Signal(dict)
+    settings_changed = Signal(object)  # lecture seule (MappingProxyType)
+    
+    # Liaisons widget <-> réglage : (onglet, widget, clé, défaut, type)
+    _BINDINGS = (
+        (0, 'export_format_combo', 'export_format', 'CDJ/USB', 'text'),
+        (0, 'key_format_combo', 'key_format', 'Open Key', 'text'),
+        (0, 'copy_music_check', 'copy_music', True, 'bool'),
+        (0, 'verify_copy_check', 'verify_copy', False, 'bool'),
+        (1, 'rekordbox_version_combo', 'rekordbox_version', 'RB6', 'text'),
+        (1, 'anlz_processes_spin', 'anlz_processes', 2, 'int'),
+        (2, 'auto_load_check', 'auto_load_collection', True, 'bool'),
+        (2, 'confirm_exit_check', 'confirm_exit', False, 'bool'),
+        (2, 'cache_size_spin', 'cache_size', 30000, 'int'),
+        (2, 'memory_limit_spin', 'memory_limit_mb', 100, 'int'),
+        (2, 'worker_threads_spin', 'worker_threads', 2, 'int'),
+        (2, 'log_level_combo', 'log_level', 'INFO', 'text'),
+        (2, 'debug_mode_check', 'debug_mode', False, 'bool')
+    )
+    
+    # Valeurs par défaut, generate_anlz est toujours actif
+    _DEFAULT_SETTINGS = MappingProxyType({
+        **{key: default for _, _, key, default, _ in _BINDINGS},
+        'generate_anlz': True
+    })
     
     def __init__(self, app_config, settings, parent=None):
         super().__init__(parent)
         self.app_config = app_config
         self.settings = settings.copy()
+        self._settings_view = MappingProxyType(self.settings)
+        self._signals_connected = False
         
         self.setWindowTitle("Traktor Bridge - Options")
         self.setModal(True)
         self.resize(500, 400)
         
         # Appliquer le même style que l'interface principale
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {self.app_config.COLORS['bg_dark']};
-                color: {self.app_config.COLORS['fg_light']};
-            }}
-            QLabel {{ 
-                color: {self.app_config.COLORS['fg_light']}; 
-            }}
-            QPushButton {{
-                background-color: {self.app_config.COLORS['bg_med']};
-                color: {self.app_config.COLORS['fg_light']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {self.app_config.COLORS['bg_light']}; 
-            }}
-            QLineEdit {{
-                background-color: {self.app_config.COLORS['bg_med']};
-                color: {self.app_config.COLORS['fg_light']};
-                border: none;
-                padding: 6px;
-                border-radius: 4px;
-            }}
-            QComboBox {{
-                background-color: {self.app_config.COLORS['bg_med']};
-                color: {self.app_config.COLORS['fg_light']};
-                border: none;
-                padding: 6px;
-                border-radius: 4px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {self.app_config.COLORS['bg_med']};
-                color: {self.app_config.COLORS['fg_light']};
-                selection-background-color: {self.app_config.COLORS['accent']};
-            }}
-            QCheckBox {{ 
-                color: {self.app_config.COLORS['fg_light']}; 
-            }}
-            QSpinBox {{
-                background-color: {self.app_config.COLORS['bg_med']};
-                color: {self.app_config.COLORS['fg_light']};
-                border: none;
-                padding: 6px;
-                border-radius: 4px;
-            }}
-            QTabWidget::pane {{
-                border: none;
-                background-color: {self.app_config.COLORS['bg_dark']};
-            }}
-            QTabBar::tab {{
-                background-color: {self.app_config.COLORS['bg_med']};
-                color: {self.app_config.COLORS['fg_light']};
-                border: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-radius: 4px 4px 0px 0px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {self.app_config.COLORS['accent']};
-            }}
-            QTabBar::tab:hover {{
-                background-color: {self.app_config.COLORS['bg_light']};
-            }}
-            QGroupBox {{
-                font-weight: bold;
-                color: {self.app_config.COLORS['accent']};
-                border: 1px solid {self.app_config.COLORS['bg_light']};
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }}
-        """)
+        self.setStyleSheet(_options_qss(tuple(self.app_config.COLORS.items())))
+        
+        # Police partagée des textes d'aide (la couleur vient de la feuille de style)
+        self._help_font = QFont(self.font())
+        self._help_font.setPointSize(9)
         
         self._setup_ui()
-        self._load_current_settings()
     
     def _setup_ui(self):
         """Setup the options dialog UI."""
@@ -114,32 +178,65 @@ class OptionsDialog(QDialog):
         
         # Title section
         title_label = QLabel("Options & Preferences")
-        title_label.setStyleSheet("font-size: 16pt; font-weight: bold;")
+        title_label.setProperty("role", "title")
         layout.addWidget(title_label)
         
         subtitle_label = QLabel("Configure export settings and application preferences")
-        subtitle_label.setStyleSheet(f"color: {self.app_config.COLORS['fg_muted']};")
+        subtitle_label.setProperty("role", "subtitle")
         layout.addWidget(subtitle_label)
         layout.addSpacing(15)
         
         # Tab widget pour organiser les options
         self.tab_widget = QTabWidget()
         
-        # Onglet Export
-        self._create_export_tab()
-        
-        # Onglet CDJ Settings
-        self._create_cdj_tab()
-        
-        # Onglet Application
-        self._create_application_tab()
+        # Onglets construits à la première activation
+        self._tab_builders = [
+            ("Export Settings", self._create_export_tab),
+            ("CDJ Settings", self._create_cdj_tab),
+            ("Application", self._create_application_tab)
+        ]
+        self._tab_built = set()
+        for title, _ in self._tab_builders:
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(0)
         
         layout.addWidget(self.tab_widget)
         
         # Buttons
         self._create_button_section(layout)
     
-    def _create_export_tab(self):
+    def _ensure_tab_built(self, index: int):
+        """Build tab contents the first time the tab is shown."""
+        if index < 0 or index in self._tab_built:
+            return
+        
+        self._tab_built.add(index)
+        title, builder = self._tab_builders[index]
+        
+        # removeTab() ne détruit pas le widget provisoire
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, builder(), title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self._load_current_settings(index)
+        
+        # Les signaux ne concernent que l'onglet Export
+        if index == 0:
+            self._connect_signals()
+    
+    def _help_label(self, text: str) -> QLabel:
+        """Create a help text label sharing the dialog's help font."""
+        label = QLabel(text)
+        label.setProperty("role", "help")
+        label.setFont(self._help_font)
+        return label
+    
+    def _create_export_tab(self) -> QWidget:
         """Create export settings tab."""
         export_widget = QWidget()
         layout = QVBoxLayout(export_widget)
@@ -150,16 +247,10 @@ class OptionsDialog(QDialog):
         format_layout = QVBoxLayout(format_group)
         
         self.export_format_combo = QComboBox()
-        self.export_format_combo.addItems([
-            "CDJ/USB",
-            "Rekordbox Database", 
-            "Rekordbox XML",
-            "M3U"
-        ])
+        self.export_format_combo.addItems(_EXPORT_FORMATS)
         format_layout.addWidget(self.export_format_combo)
         
-        format_help = QLabel("Select the target format for your export")
-        format_help.setStyleSheet(f"color: {self.app_config.COLORS['fg_muted']}; font-size: 9pt;")
+        format_help = self._help_label("Select the target format for your export")
         format_layout.addWidget(format_help)
         
         layout.addWidget(format_group)
@@ -169,16 +260,10 @@ class OptionsDialog(QDialog):
         key_layout = QVBoxLayout(key_group)
         
         self.key_format_combo = QComboBox()
-        self.key_format_combo.addItems([
-            "Open Key",
-            "Camelot",
-            "Traditional",
-            "Mixed In Key"
-        ])
+        self.key_format_combo.addItems(_KEY_FORMATS)
         key_layout.addWidget(self.key_format_combo)
         
-        key_help = QLabel("Choose musical key notation system")
-        key_help.setStyleSheet(f"color: {self.app_config.COLORS['fg_muted']}; font-size: 9pt;")
+        key_help = self._help_label("Choose musical key notation system")
         key_layout.addWidget(key_help)
         
         layout.addWidget(key_group)
@@ -197,9 +282,9 @@ class OptionsDialog(QDialog):
         
         layout.addStretch()
         
-        self.tab_widget.addTab(export_widget, "Export Settings")
+        return export_widget
     
-    def _create_cdj_tab(self):
+    def _create_cdj_tab(self) -> QWidget:
         """Create CDJ-specific settings tab."""
         cdj_widget = QWidget()
         layout = QVBoxLayout(cdj_widget)
@@ -210,11 +295,10 @@ class OptionsDialog(QDialog):
         target_layout = QVBoxLayout(target_group)
 
         target_label = QLabel("CDJ-2000NXS2")
-        target_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        target_label.setProperty("role", "target")
         target_layout.addWidget(target_label)
 
-        target_help = QLabel("Traktor Bridge is optimized for CDJ-2000NXS2 hardware export")
-        target_help.setStyleSheet(f"color: {self.app_config.COLORS['fg_muted']}; font-size: 9pt;")
+        target_help = self._help_label("Traktor Bridge is optimized for CDJ-2000NXS2 hardware export")
         target_layout.addWidget(target_help)
 
         layout.addWidget(target_group)
@@ -229,8 +313,7 @@ class OptionsDialog(QDialog):
 
         features_layout.addWidget(self.generate_anlz_check)
 
-        anlz_help = QLabel("ANLZ files provide waveforms and beat grids on CDJ display")
-        anlz_help.setStyleSheet(f"color: {self.app_config.COLORS['fg_muted']}; font-size: 9pt;")
+        anlz_help = self._help_label("ANLZ files provide waveforms and beat grids on CDJ display")
         features_layout.addWidget(anlz_help)
 
         # ANLZ Processes (multiprocessing)
@@ -256,20 +339,19 @@ class OptionsDialog(QDialog):
         rb_layout = QVBoxLayout(rb_group)
 
         self.rekordbox_version_combo = QComboBox()
-        self.rekordbox_version_combo.addItems(["RB6", "RB7"])
+        self.rekordbox_version_combo.addItems(_RB_VERSIONS)
         rb_layout.addWidget(self.rekordbox_version_combo)
 
-        rb_help = QLabel("Target Rekordbox version (for Rekordbox Database export only)")
-        rb_help.setStyleSheet(f"color: {self.app_config.COLORS['fg_muted']}; font-size: 9pt;")
+        rb_help = self._help_label("Target Rekordbox version (for Rekordbox Database export only)")
         rb_layout.addWidget(rb_help)
 
         layout.addWidget(rb_group)
 
         layout.addStretch()
 
-        self.tab_widget.addTab(cdj_widget, "CDJ Settings")
+        return cdj_widget
     
-    def _create_application_tab(self):
+    def _create_application_tab(self) -> QWidget:
         """Create application settings tab."""
         app_widget = QWidget()
         layout = QVBoxLayout(app_widget)
@@ -309,31 +391,20 @@ class OptionsDialog(QDialog):
         
         # Logging Group
         log_group = QGroupBox("Logging & Debug")
-        log_layout = QVBoxLayout(log_group)
+        log_layout = QFormLayout(log_group)
         
-        log_level_layout = QHBoxLayout()
-        log_level_label = QLabel("Log level:")
         self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems([
-            "DEBUG",
-            "INFO", 
-            "WARNING",
-            "ERROR"
-        ])
-        log_level_layout.addWidget(log_level_label)
-        log_level_layout.addWidget(self.log_level_combo)
-        log_level_layout.addStretch()
-        
-        log_layout.addLayout(log_level_layout)
+        self.log_level_combo.addItems(_LOG_LEVELS)
+        log_layout.addRow("Log level:", self.log_level_combo)
         
         self.debug_mode_check = QCheckBox("Enable debug mode")
-        log_layout.addWidget(self.debug_mode_check)
+        log_layout.addRow(self.debug_mode_check)
         
         layout.addWidget(log_group)
         
         layout.addStretch()
         
-        self.tab_widget.addTab(app_widget, "Application")
+        return app_widget
     
     def _create_button_section(self, parent_layout):
         """Create button section."""
@@ -345,54 +416,62 @@ class OptionsDialog(QDialog):
         reset_button.clicked.connect(self._reset_to_defaults)
         
         # Standard buttons
-        button_box = QDialogButtonBox(
+        self.button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | 
             QDialogButtonBox.StandardButton.Cancel | 
             QDialogButtonBox.StandardButton.Apply
         )
         
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
-        button_box.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply_settings)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.button_box.clicked.connect(self._on_button_clicked)
         
         button_layout.addWidget(reset_button)
         button_layout.addStretch()
-        button_layout.addWidget(button_box)
+        button_layout.addWidget(self.button_box)
         
         parent_layout.addLayout(button_layout)
     
-    def _load_current_settings(self):
-        """Load current settings into UI controls."""
-        # Export tab
-        self.export_format_combo.setCurrentText(self.settings.get('export_format', 'CDJ/USB'))
-        self.key_format_combo.setCurrentText(self.settings.get('key_format', 'Open Key'))
-        self.copy_music_check.setChecked(self.settings.get('copy_music', True))
-        self.verify_copy_check.setChecked(self.settings.get('verify_copy', False))
-        
-        # CDJ tab
-        self.rekordbox_version_combo.setCurrentText(self.settings.get('rekordbox_version', 'RB6'))
-        self.anlz_processes_spin.setValue(self.settings.get('anlz_processes', 2))
-        
-        # Application tab
-        self.auto_load_check.setChecked(self.settings.get('auto_load_collection', True))
-        self.confirm_exit_check.setChecked(self.settings.get('confirm_exit', False))
-        self.cache_size_spin.setValue(self.settings.get('cache_size', 30000))
-        self.memory_limit_spin.setValue(self.settings.get('memory_limit_mb', 100))
-        self.worker_threads_spin.setValue(self.settings.get('worker_threads', 2))
-        self.log_level_combo.setCurrentText(self.settings.get('log_level', 'INFO'))
-        self.debug_mode_check.setChecked(self.settings.get('debug_mode', False))
-        
-        # Connect signals for real-time updates
-        self._connect_signals()
+    def _on_button_clicked(self, button):
+        """Dispatch button box clicks not covered by accepted/rejected."""
+        if self.button_box.buttonRole(button) == QDialogButtonBox.ButtonRole.ApplyRole:
+            self._apply_settings()
+    
+    def _load_current_settings(self, index: Optional[int] = None):
+        """Load current settings into UI controls of one or all built tabs."""
+        tabs = self._tab_built if index is None else {index}
+        
+        # Une seule mise à jour visuelle pour l'ensemble des contrôles
+        self.setUpdatesEnabled(False)
+        try:
+            for tab, widget_name, key, default, kind in self._BINDINGS:
+                if tab not in tabs:
+                    continue
+                widget = getattr(self, widget_name)
+                value = self.settings.get(key, default)
+                with QSignalBlocker(widget):
+                    if kind == 'text':
+                        widget.setCurrentText(value)
+                    elif kind == 'bool':
+                        widget.setChecked(value)
+                    else:
+                        widget.setValue(value)
+            
+            if 0 in tabs:
+                self._update_verify_copy_state()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _connect_signals(self):
-        """Connect signals for real-time setting updates."""
+        """Connect signals for real-time setting updates (once per dialog)."""
+        if self._signals_connected:
+            return
+        self._signals_connected = True
+        
         # Export tab
-        self.export_format_combo.currentTextChanged.connect(self._on_export_format_changed)
+        # textActivated ne concerne que les choix de l'utilisateur, pas les chargements
+        self.export_format_combo.textActivated.connect(self._on_export_format_changed)
         self.copy_music_check.toggled.connect(self._update_verify_copy_state)
-        
-        # Update verify copy state initially
-        self._update_verify_copy_state()
     
     def _on_export_format_changed(self, format_name: str):
         """Handle export format change."""
@@ -421,29 +500,24 @@ class OptionsDialog(QDialog):
     def _apply_settings(self):
         """Apply current settings without closing dialog."""
         self._save_settings()
-        self.settings_changed.emit(self.settings)
+        self.settings_changed.emit(self._settings_view)
     
     def _save_settings(self):
-        """Save all settings from UI controls."""
-        # Export tab
-        self.settings['export_format'] = self.export_format_combo.currentText()
-        self.settings['key_format'] = self.key_format_combo.currentText()
-        self.settings['copy_music'] = self.copy_music_check.isChecked()
-        self.settings['verify_copy'] = self.verify_copy_check.isChecked()
-        
-        # CDJ tab
-        self.settings['generate_anlz'] = self.generate_anlz_check.isChecked()
-        self.settings['rekordbox_version'] = self.rekordbox_version_combo.currentText()
-        self.settings['anlz_processes'] = self.anlz_processes_spin.value()
-        
-        # Application tab
-        self.settings['auto_load_collection'] = self.auto_load_check.isChecked()
-        self.settings['confirm_exit'] = self.confirm_exit_check.isChecked()
-        self.settings['cache_size'] = self.cache_size_spin.value()
-        self.settings['memory_limit_mb'] = self.memory_limit_spin.value()
-        self.settings['worker_threads'] = self.worker_threads_spin.value()
-        self.settings['log_level'] = self.log_level_combo.currentText()
-        self.settings['debug_mode'] = self.debug_mode_check.isChecked()
+        """Save settings from UI controls of built tabs."""
+        for tab, widget_name, key, default, kind in self._BINDINGS:
+            if tab not in self._tab_built:
+                continue
+            widget = getattr(self, widget_name)
+            if kind == 'text':
+                self.settings[key] = widget.currentText()
+            elif kind == 'bool':
+                self.settings[key] = widget.isChecked()
+            else:
+                self.settings[key] = widget.value()
+        
+        # Toujours actif, non modifiable par l'utilisateur
+        if 1 in self._tab_built:
+            self.settings['generate_anlz'] = self.generate_anlz_check.isChecked()
     
     def _reset_to_defaults(self):
         """Reset all settings to default values."""
@@ -456,42 +530,32 @@ class OptionsDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Default settings
-            default_settings = {
-                'export_format': 'CDJ/USB',
-                'key_format': 'Open Key',
-                'copy_music': True,
-                'verify_copy': False,
-                'generate_anlz': True,
-                'anlz_processes': 2,
-                'rekordbox_version': 'RB6',
-                'auto_load_collection': True,
-                'confirm_exit': False,
-                'cache_size': 30000,
-                'memory_limit_mb': 100,
-                'worker_threads': 2,
-                'log_level': 'INFO',
-                'debug_mode': False
-            }
-            
-            self.settings.update(default_settings)
+            self.settings.update(self._DEFAULT_SETTINGS)
             self._load_current_settings()
     
+    def refresh(self, settings):
+        """Reload the dialog from the given settings before reopening it."""
+        # Même dictionnaire pour que la vue en lecture seule reste valide
+        self.settings.clear()
+        self.settings.update(settings)
+        self._load_current_settings()
+    
     def get_settings(self):
-        """Get current settings dictionary."""
-        return self.settings.copy()
+        """Get a read-only view of the current settings."""
+        return self._settings_view
     
     def accept(self):
         """Handle dialog accept (OK button)."""
         self._save_settings()
-        self.settings_changed.emit(self.settings)
+        self.settings_changed.emit(self._settings_view)
         super().accept()
     
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts."""
         if event.key() == Qt.Key.Key_Escape:
             self.reject()
-        elif event.matches(QKeySequence.StandardKey.Save):
+        elif (event.key() == Qt.Key.Key_S
+              and event.modifiers() & Qt.KeyboardModifier.ControlModifier):
             self._apply_settings()
         else:
             super().keyPressEvent(event)
@@ -3,11 +3,56 @@ Timeline Dialog Module for Traktor Bridge
 Visual timeline view of track cue points with enhanced visualization
 """
 
+import heapq
 import math
+from functools import lru_cache
 from typing import List, Dict
 from PySide6.QtWidgets import *
-from PySide6.QtCore import Qt, QRectF, QRect, QPoint
-from PySide6.QtGui import QPen, QColor, QBrush, QFont, QPainter
+from PySide6.QtCore import Qt, QRectF, QRect, QPoint, QPointF, QLine, QSignalBlocker
+from PySide6.QtGui import QPen, QColor, QBrush, QFont, QPainter, QLinearGradient, QPixmap, QStaticText, QPolygon
+from utils.playlist import CueType
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Cue type values compared in every paint and table refresh
+_HOT = CueType.HOT_CUE.value
+_LOAD = CueType.LOAD.value
+_LOOP = CueType.LOOP.value
+
+
+@lru_cache(maxsize=512)
+def _format_time(ms):
+    """Format milliseconds as MM:SS.ss."""
+    seconds = ms / 1000
+    minutes = int(seconds // 60)
+    seconds = seconds % 60
+    return f"{minutes:02d}:{seconds:05.2f}"
+
+
+@lru_cache(maxsize=8)
+def _waveform_samples(width: int):
+    """Return (x, y_offset) pairs of the simulated waveform for a given widget width."""
+    if width <= 20:
+        return ()
+    if NUMPY_AVAILABLE:
+        xs = np.arange(10, width - 10, 2)
+        pos_ratio = (xs - 10) / (width - 20)
+        amp_factor = np.sin(pos_ratio * 3.14) * 0.8 + 0.2
+        freq = 0.2 + pos_ratio * 0.1
+        y_offset = np.sin(pos_ratio * 100 * freq) * 10 * amp_factor
+        return tuple(zip(xs.tolist(), y_offset.tolist()))
+    
+    samples = []
+    for x in range(10, width - 10, 2):
+        pos_ratio = (x - 10) / (width - 20)
+        amp_factor = math.sin(pos_ratio * 3.14) * 0.8 + 0.2
+        freq = 0.2 + pos_ratio * 0.1
+        samples.append((x, math.sin(pos_ratio * 100 * freq) * 10 * amp_factor))
+    return tuple(samples)
 
 
 class TimelineDialog(QDialog):
@@ -23,12 +68,20 @@ class TimelineDialog(QDialog):
         self.setModal(True)
         
         # Filter relevant cue points
-        from utils.playlist import CueType
         self.cue_points = sorted(
             [cue for cue in track.cue_points if self._is_relevant_cue(cue)],
             key=lambda c: c.get('start', 0)
         )
         
+        # Relevant cues bucketed by type, each bucket keeping start order
+        self._hot_cues, self._memory_cues, self._loop_cues = [], [], []
+        self._cue_buckets = {_HOT: self._hot_cues, _LOAD: self._memory_cues, _LOOP: self._loop_cues}
+        for cue in self.cue_points:
+            self._cue_buckets[cue.get('type', -1)].append(cue)
+        
+        # Position in self.cue_points (start order, ties as in the table)
+        self._cue_order = {id(cue): index for index, cue in enumerate(self.cue_points)}
+        
         # Filter states
         self.show_hotcues = True
         self.show_memory_cues = True
@@ -39,11 +92,21 @@ class TimelineDialog(QDialog):
     
     def _is_relevant_cue(self, cue):
         """Determine if cue point is relevant for display."""
-        from utils.playlist import CueType
         cue_type = cue.get('type', -1)
-        hotcue_num = cue.get('hotcue', -1)
-        return ((cue_type == CueType.HOT_CUE.value and hotcue_num > 0) or 
-                cue_type in [CueType.LOAD.value, CueType.LOOP.value])
+        return ((cue_type == _HOT and cue.get('hotcue', -1) > 0) or 
+                cue_type == _LOAD or cue_type == _LOOP)
+    
+    def _visible_cues(self):
+        """Iterate the cues allowed by the current filters, in self.cue_points order."""
+        buckets = []
+        if self.show_hotcues:
+            buckets.append(self._hot_cues)
+        if self.show_memory_cues:
+            buckets.append(self._memory_cues)
+        if self.show_loops:
+            buckets.append(self._loop_cues)
+        cue_order = self._cue_order
+        return heapq.merge(*buckets, key=lambda c: cue_order[id(c)])
     
     def _setup_ui(self):
         """Setup the timeline dialog interface."""
@@ -138,12 +201,8 @@ class TimelineDialog(QDialog):
     
     def _get_cue_stats(self):
         """Generate cue point statistics."""
-        from utils.playlist import CueType
-        hot_cues = sum(1 for cue in self.cue_points if cue.get('type') == CueType.HOT_CUE.value)
-        memory_cues = sum(1 for cue in self.cue_points if cue.get('type') == CueType.LOAD.value)
-        loops = sum(1 for cue in self.cue_points if cue.get('type') == CueType.LOOP.value)
-        
-        stats = f"Total: {len(self.cue_points)} points ({hot_cues} Hot Cues, {memory_cues} Memory Cues, {loops} Loops"
+        stats = (f"Total: {len(self.cue_points)} points ({len(self._hot_cues)} Hot Cues, "
+                 f"{len(self._memory_cues)} Memory Cues, {len(self._loop_cues)} Loops")
         if self.track.grid_anchor_ms is not None:
             stats += ", 1 Grid Anchor"
         stats += ")"
@@ -154,10 +213,11 @@ class TimelineDialog(QDialog):
         """Create enhanced timeline visualization widget."""
         
         class TimelineView(QWidget):
-            def __init__(self, track, cue_points, parent=None):
+            def __init__(self, track, cue_points, cue_buckets, parent=None):
                 super().__init__(parent)
                 self.track = track
                 self.cue_points = cue_points
+                self.cue_buckets = cue_buckets
                 self.setMinimumHeight(100)
                 self.setStyleSheet("background-color: #343a40;")
                 
@@ -165,33 +225,61 @@ class TimelineDialog(QDialog):
                 self.show_memory_cues = True
                 self.show_loops = True
                 self.show_grid = True
+                
+                # Static layers, rebuilt on resize
+                self._bg_cache = None
+                self._wave_xy = ()
+                self._visibility = {_HOT: True, _LOAD: True, _LOOP: True}
+                self._filtered_cues = list(cue_points)
+                self._cue_positions = []
+                self._hotcue_texts = {}
+                self._diamond = QPolygon([QPoint(0, -6), QPoint(6, 0), QPoint(0, 6), QPoint(-6, 0)])
             
             def update_filters(self, show_hotcues, show_memory_cues, show_loops, show_grid):
                 self.show_hotcues = show_hotcues
                 self.show_memory_cues = show_memory_cues
                 self.show_loops = show_loops
                 self.show_grid = show_grid
+                self._visibility = {_HOT: show_hotcues, _LOAD: show_memory_cues, _LOOP: show_loops}
+                self._filtered_cues = [cue for cue_type, bucket in self.cue_buckets.items()
+                                       if self._visibility[cue_type] for cue in bucket]
+                self._update_cue_positions()
                 self.update()
             
-            def paintEvent(self, event):
-                painter = QPainter(self)
-                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-                
+            def _update_cue_positions(self):
+                """Map the start of each visible cue to its x position on the timeline."""
+                total_duration = self.track.playtime * 1000 if self.track.playtime > 0 else 1
+                scale = (self.width() - 20) / total_duration
+                if NUMPY_AVAILABLE:
+                    starts = np.fromiter((c.get('start', 0) for c in self._filtered_cues),
+                                         dtype=np.float64, count=len(self._filtered_cues))
+                    self._cue_positions = (10 + starts * scale).tolist()
+                else:
+                    self._cue_positions = [10 + c.get('start', 0) * scale for c in self._filtered_cues]
+            
+            def resizeEvent(self, event):
+                self._bg_cache = None
+                self._wave_xy = _waveform_samples(event.size().width())
+                self._update_cue_positions()
+                super().resizeEvent(event)
+            
+            def _build_background(self):
+                """Render the static layers (gradient, timeline, waveform, markers) once."""
                 width = self.width()
                 height = self.height()
+                dpr = self.devicePixelRatioF()
+                
+                pixmap = QPixmap(int(width * dpr), int(height * dpr))
+                pixmap.setDevicePixelRatio(dpr)
+                
+                painter = QPainter(pixmap)
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing)
                 
                 # Background gradient
-                gradient = QColor('#343a40')
-                gradient_dark = QColor('#212529')
-                for y in range(height):
-                    blend_factor = y / height
-                    color = QColor(
-                        int(gradient.red() * (1 - blend_factor) + gradient_dark.red() * blend_factor),
-                        int(gradient.green() * (1 - blend_factor) + gradient_dark.green() * blend_factor),
-                        int(gradient.blue() * (1 - blend_factor) + gradient_dark.blue() * blend_factor)
-                    )
-                    painter.setPen(color)
-                    painter.drawLine(0, y, width, y)
+                gradient = QLinearGradient(0, 0, 0, height)
+                gradient.setColorAt(0.0, QColor('#343a40'))
+                gradient.setColorAt(1.0, QColor('#212529'))
+                painter.fillRect(0, 0, width, height, gradient)
                 
                 # Main timeline
                 painter.setPen(QPen(QColor('#888888'), 2))
@@ -202,22 +290,13 @@ class TimelineDialog(QDialog):
                 wave_color = QColor('#555555')
                 painter.setPen(QPen(wave_color, 1))
                 
-                for x in range(10, width - 10, 2):
-                    pos_ratio = (x - 10) / (width - 20)
-                    amp_factor = math.sin(pos_ratio * 3.14) * 0.8 + 0.2
-                    freq = 0.2 + pos_ratio * 0.1
-                    y_offset = math.sin(pos_ratio * 100 * freq) * 10 * amp_factor
-                    painter.drawLine(x, mid_y + y_offset, x, mid_y - y_offset)
+                painter.drawLines([QLine(x, int(mid_y + y_offset), x, int(mid_y - y_offset))
+                                   for x, y_offset in self._wave_xy])
                 
-                # Time markers
+                # Time markers, axis-aligned so drawn without antialiasing
                 total_duration = self.track.playtime * 1000 if self.track.playtime > 0 else 1
                 
-                def format_time(ms):
-                    seconds = ms / 1000
-                    minutes = int(seconds // 60)
-                    seconds = seconds % 60
-                    return f"{minutes:02d}:{seconds:05.2f}"
-                
+                painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
                 painter.setPen(QPen(QColor('#AAAAAA'), 1))
                 for i in range(6):
                     x_pos = 10 + (i * ((width - 20) / 5))
@@ -225,7 +304,22 @@ class TimelineDialog(QDialog):
                     
                     painter.drawLine(x_pos, mid_y - 5, x_pos, mid_y + 5)
                     painter.drawText(QRectF(x_pos - 40, mid_y + 10, 80, 20), 
-                                  Qt.AlignmentFlag.AlignCenter, format_time(time_pos))
+                                  Qt.AlignmentFlag.AlignCenter, _format_time(time_pos))
+                
+                painter.end()
+                return pixmap
+            
+            def paintEvent(self, event):
+                if self._bg_cache is None:
+                    self._bg_cache = self._build_background()
+                
+                painter = QPainter(self)
+                painter.drawPixmap(0, 0, self._bg_cache)
+                
+                width = self.width()
+                height = self.height()
+                mid_y = height // 2
+                total_duration = self.track.playtime * 1000 if self.track.playtime > 0 else 1
                 
                 # Grid anchor
                 if self.show_grid and self.track.grid_anchor_ms is not None:
@@ -236,72 +330,81 @@ class TimelineDialog(QDialog):
                     
                     painter.setBrush(QBrush(grid_color))
                     painter.setPen(QPen(grid_color.darker(120), 1))
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
                     
-                    size = 6
-                    points = [
-                        QPoint(int(grid_pos), mid_y - size),
-                        QPoint(int(grid_pos + size), mid_y),
-                        QPoint(int(grid_pos), mid_y + size),
-                        QPoint(int(grid_pos - size), mid_y)
-                    ]
-                    painter.drawPolygon(points)
+                    painter.drawConvexPolygon(self._diamond.translated(int(grid_pos), mid_y))
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+                
+                # Cue points with colors, grouped by type to set pen and brush once per group
+                hot_cues, memory_cues, loops = [], [], []
+                buckets = {_HOT: hot_cues, _LOAD: memory_cues, _LOOP: loops}
+                for cue, position in zip(self._filtered_cues, self._cue_positions):
+                    cue_type = cue.get('type', -1)
+                    bucket = buckets.get(cue_type)
+                    if bucket is None:
+                        continue
+                    x = int(position)
+                    if bucket and bucket[-1][1] == x and cue_type != _LOOP:
+                        # Same pixel as the previous marker of this type: only the last one shows
+                        bucket[-1] = (cue, x)
+                    else:
+                        bucket.append((cue, x))
                 
-                # Cue points with colors
-                from utils.playlist import CueType
-                cue_colors = {
-                    CueType.HOT_CUE.value: QColor('#ff4d4d'),
-                    CueType.LOAD.value: QColor('#4da6ff'),
-                    CueType.LOOP.value: QColor('#4dff88')
-                }
+                if hot_cues:
+                    # Hot Cue - Square with number
+                    color = QColor('#ff4d4d')
+                    painter.setBrush(QBrush(color))
+                    painter.setPen(QPen(color.darker(120), 1))
+                    size = 12
+                    painter.drawRects([QRect(x - size//2, mid_y - size//2, size, size)
+                                       for _, x in hot_cues])
+                    
+                    painter.setPen(QPen(QColor('#FFFFFF'), 1))
+                    for cue, x in hot_cues:
+                        text = self._hotcue_text(str(cue.get('hotcue', '-')))
+                        text_size = text.size()
+                        painter.drawStaticText(QPointF(x - text_size.width() / 2,
+                                                       mid_y - text_size.height() / 2), text)
                 
-                filtered_cues = [c for c in self.cue_points if self._is_visible(c)]
+                if memory_cues:
+                    # Memory Cue - Circle
+                    color = QColor('#4da6ff')
+                    painter.setBrush(QBrush(color))
+                    painter.setPen(QPen(color.darker(120), 1))
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                    for _, x in memory_cues:
+                        painter.drawEllipse(QPoint(x, mid_y), 6, 6)
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
                 
-                for cue in filtered_cues:
-                    position = 10 + ((cue.get('start', 0) / total_duration) * (width - 20))
-                    cue_type = cue.get('type', -1)
+                loops = [(cue, x) for cue, x in loops if cue.get('len', 0) > 0]
+                if loops:
+                    # Loop - Circle with rectangle
+                    color = QColor('#4dff88')
+                    painter.setBrush(QBrush(color))
+                    painter.setPen(QPen(color.darker(120), 1))
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+                    for _, x in loops:
+                        painter.drawEllipse(QPoint(x, mid_y), 6, 6)
+                    painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
                     
-                    if cue_type in cue_colors:
-                        color = cue_colors[cue_type]
-                        painter.setBrush(QBrush(color))
-                        painter.setPen(QPen(color.darker(120), 1))
-                        
-                        if cue_type == CueType.HOT_CUE.value:
-                            # Hot Cue - Square with number
-                            size = 12
-                            painter.drawRect(int(position) - size//2, mid_y - size//2, size, size)
-                            painter.setPen(QPen(QColor('#FFFFFF'), 1))
-                            hotcue_num = str(cue.get('hotcue', '-'))
-                            painter.drawText(QRect(int(position) - 6, mid_y - 7, 12, 14), 
-                                          Qt.AlignmentFlag.AlignCenter, hotcue_num)
-                        
-                        elif cue_type == CueType.LOAD.value:
-                            # Memory Cue - Circle
-                            painter.drawEllipse(QPoint(int(position), mid_y), 6, 6)
-                            
-                        elif cue_type == CueType.LOOP.value and cue.get('len', 0) > 0:
-                            # Loop - Circle with rectangle
-                            painter.drawEllipse(QPoint(int(position), mid_y), 6, 6)
-                            
-                            end_position = 10 + (((cue.get('start', 0) + cue.get('len', 0)) / total_duration) * (width - 20))
-                            
-                            loop_color = QColor(color)
-                            loop_color.setAlpha(80)
-                            painter.setBrush(QBrush(loop_color))
-                            painter.setPen(QPen(color, 1, Qt.PenStyle.DashLine))
-                            painter.drawRect(QRect(int(position), mid_y - 10, int(end_position - position), 20))
+                    loop_color = QColor(color)
+                    loop_color.setAlpha(80)
+                    painter.setBrush(QBrush(loop_color))
+                    painter.setPen(QPen(color, 1, Qt.PenStyle.DashLine))
+                    scale = (width - 20) / total_duration
+                    for cue, x in loops:
+                        painter.drawRect(QRect(x, mid_y - 10, int(cue['len'] * scale), 20))
             
-            def _is_visible(self, cue):
-                from utils.playlist import CueType
-                cue_type = cue.get('type', -1)
-                if cue_type == CueType.HOT_CUE.value:
-                    return self.show_hotcues
-                elif cue_type == CueType.LOAD.value:
-                    return self.show_memory_cues
-                elif cue_type == CueType.LOOP.value:
-                    return self.show_loops
-                return False
-        
-        return TimelineView(self.track, self.cue_points)
+            def _hotcue_text(self, label):
+                """Return the cached QStaticText for a hot cue number."""
+                text = self._hotcue_texts.get(label)
+                if text is None:
+                    text = QStaticText(label)
+                    text.prepare(font=self.font())
+                    self._hotcue_texts[label] = text
+                return text
+        
+        return TimelineView(self.track, self.cue_points, self._cue_buckets)
     
     def _create_cue_table(self):
         """Create detailed cue points table."""
@@ -322,78 +425,87 @@ class TimelineDialog(QDialog):
         return table
     
     def _populate_cue_table(self, table):
-        """Populate cue table with data."""
-        table.clear()
-        
-        def format_time(ms):
-            seconds = ms / 1000
-            minutes = int(seconds // 60)
-            seconds = seconds % 60
-            return f"{minutes:02d}:{seconds:05.2f}"
+        """Populate cue table with one row per cue; filters only hide rows."""
+        items = []
+        self._grid_item = None
         
-        # Add Grid Anchor if present and visible
-        if self.track.grid_anchor_ms is not None and self.show_grid:
-            grid_item = QTreeWidgetItem()
-            grid_item.setText(0, "G")
-            grid_item.setText(1, format_time(self.track.grid_anchor_ms))
-            grid_item.setText(2, "Grid Anchor")
-            grid_item.setText(3, "-")
-            grid_item.setText(4, "BPM Beat 1")
-            grid_item.setText(5, f"BPM: {self.track.bpm:.2f}")
+        # Add Grid Anchor if present
+        if self.track.grid_anchor_ms is not None:
+            grid_item = QTreeWidgetItem([
+                "G", _format_time(self.track.grid_anchor_ms), "Grid Anchor", "-",
+                "BPM Beat 1", f"BPM: {self.track.bpm:.2f}"
+            ])
             
             for col in range(6):
                 grid_item.setForeground(col, QColor('#00FFFF'))
                 
-            table.addTopLevelItem(grid_item)
+            items.append(grid_item)
+            self._grid_item = grid_item
         
-        # Add cue points
-        row_index = 1
+        # Add cue points, numbered when filters are applied
+        self._cue_items = []
         
-        from utils.playlist import CueType
         for cue in self.cue_points:
-            if (cue.get('type') == CueType.HOT_CUE.value and not self.show_hotcues or
-                cue.get('type') == CueType.LOAD.value and not self.show_memory_cues or
-                cue.get('type') == CueType.LOOP.value and not self.show_loops):
-                continue
-                
-            item = QTreeWidgetItem()
-            
             cue_type = cue.get('type')
             type_str = "Unknown"
             details_str = ""
             name_str = cue.get('name', '')
             
-            if cue_type == CueType.HOT_CUE.value:
+            if cue_type == _HOT:
                 type_str = f"Hot Cue {cue.get('hotcue')}"
                 details_str = "One-shot trigger point"
-            elif cue_type == CueType.LOAD.value:
+            elif cue_type == _LOAD:
                 type_str = "Memory Cue"
                 details_str = "Navigation marker"
-            elif cue_type == CueType.LOOP.value:
+            elif cue_type == _LOOP:
                 type_str = "Loop"
                 details_str = "Auto-repeating section"
             
             length_str = "-"
-            if cue_type == CueType.LOOP.value and cue.get('len', 0) > 0:
-                length_str = format_time(cue.get('len', 0))
+            if cue_type == _LOOP and cue.get('len', 0) > 0:
+                length_str = _format_time(cue.get('len', 0))
             
-            item.setText(0, str(row_index))
-            item.setText(1, format_time(cue.get('start', 0)))
-            item.setText(2, type_str)
-            item.setText(3, length_str)
-            item.setText(4, name_str)
-            item.setText(5, details_str)
+            item = QTreeWidgetItem([
+                "", _format_time(cue.get('start', 0)), type_str,
+                length_str, name_str, details_str
+            ])
             
             # Color coding
-            if cue_type == CueType.HOT_CUE.value:
+            if cue_type == _HOT:
                 item.setForeground(2, QColor('#ff4d4d'))
-            elif cue_type == CueType.LOAD.value:
+            elif cue_type == _LOAD:
                 item.setForeground(2, QColor('#4da6ff'))
-            elif cue_type == CueType.LOOP.value:
+            elif cue_type == _LOOP:
                 item.setForeground(2, QColor('#4dff88'))
             
-            table.addTopLevelItem(item)
-            row_index += 1
+            items.append(item)
+            self._cue_items.append(item)
+        
+        # Swap all rows in one batch without per-row repaints
+        table.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(table):
+                table.clear()
+                table.addTopLevelItems(items)
+            self._apply_table_filters()
+        finally:
+            table.setUpdatesEnabled(True)
+    
+    def _apply_table_filters(self):
+        """Show rows matching the current filters and renumber the visible cues."""
+        if self._grid_item is not None:
+            self._grid_item.setHidden(not self.show_grid)
+        
+        row_index = 1
+        for cue, item in zip(self.cue_points, self._cue_items):
+            cue_type = cue.get('type')
+            hidden = (cue_type == _HOT and not self.show_hotcues or
+                      cue_type == _LOAD and not self.show_memory_cues or
+                      cue_type == _LOOP and not self.show_loops)
+            item.setHidden(hidden)
+            if not hidden:
+                item.setText(0, str(row_index))
+                row_index += 1
     
     def _update_filters(self):
         """Update filters and refresh display."""
@@ -409,74 +521,62 @@ class TimelineDialog(QDialog):
             self.show_grid
         )
         
-        self._populate_cue_table(self.cue_table)
+        self.cue_table.setUpdatesEnabled(False)
+        try:
+            self._apply_table_filters()
+        finally:
+            self.cue_table.setUpdatesEnabled(True)
     
     def _export_to_clipboard(self):
         """Export cue point data to clipboard."""
-        clipboard_text = f"Cue Points: {self.track.artist} - {self.track.title}\n"
-        clipboard_text += f"BPM: {self.track.bpm:.1f}\n"
+        lines = [
+            f"Cue Points: {self.track.artist} - {self.track.title}",
+            f"BPM: {self.track.bpm:.1f}"
+        ]
         if self.track.musical_key:
             key = self.key_translator.translate(self.track.musical_key)
-            clipboard_text += f"Key: {key}\n"
-        clipboard_text += f"Duration: {int(self.track.playtime // 60)}:{int(self.track.playtime % 60):02d}\n"
+            lines.append(f"Key: {key}")
+        lines.append(f"Duration: {int(self.track.playtime // 60)}:{int(self.track.playtime % 60):02d}")
         
         if self.track.grid_anchor_ms is not None:
             ms = self.track.grid_anchor_ms
             minutes = int(ms // 60000)
             seconds = (ms % 60000) / 1000
             grid_time = f"{minutes:02d}:{seconds:06.3f}"
-            clipboard_text += f"Grid Anchor: {grid_time}\n"
+            lines.append(f"Grid Anchor: {grid_time}")
             
-        clipboard_text += "-" * 50 + "\n"
-        
-        def format_time(ms):
-            seconds = ms / 1000
-            minutes = int(seconds // 60)
-            seconds = seconds % 60
-            return f"{minutes:02d}:{seconds:05.2f}"
+        lines.append("-" * 50)
         
+        points_count = 0
         if self.track.grid_anchor_ms is not None and self.show_grid:
-            clipboard_text += f"G. Grid Anchor @ {format_time(self.track.grid_anchor_ms)} - Beat 1\n"
+            lines.append(f"G. Grid Anchor @ {_format_time(self.track.grid_anchor_ms)} - Beat 1")
+            points_count += 1
         
         idx = 1
-        from utils.playlist import CueType
-        for cue in self.cue_points:
-            if (cue.get('type') == CueType.HOT_CUE.value and not self.show_hotcues or
-                cue.get('type') == CueType.LOAD.value and not self.show_memory_cues or
-                cue.get('type') == CueType.LOOP.value and not self.show_loops):
-                continue
-                
+        for cue in self._visible_cues():
             cue_type = cue.get('type')
             
-            if cue_type == CueType.HOT_CUE.value:
+            if cue_type == _HOT:
                 type_str = f"Hot Cue {cue.get('hotcue')}"
-            elif cue_type == CueType.LOAD.value:
+            elif cue_type == _LOAD:
                 type_str = "Memory Cue"
-            elif cue_type == CueType.LOOP.value:
+            elif cue_type == _LOOP:
                 type_str = "Loop"
                 
-            line = f"{idx}. {type_str} @ {format_time(cue.get('start', 0))}"
+            line = f"{idx}. {type_str} @ {_format_time(cue.get('start', 0))}"
             
-            if cue_type == CueType.LOOP.value and cue.get('len', 0) > 0:
-                line += f" - Length: {format_time(cue.get('len', 0))}"
+            if cue_type == _LOOP and cue.get('len', 0) > 0:
+                line += f" - Length: {_format_time(cue.get('len', 0))}"
                 
             name = cue.get('name', '')
             if name:
                 line += f" - '{name}'"
                 
-            clipboard_text += line + "\n"
+            lines.append(line)
             idx += 1
         
-        QApplication.clipboard().setText(clipboard_text)
-        
-        points_count = sum(1 for cue in self.cue_points if (
-            (cue.get('type') == CueType.HOT_CUE.value and self.show_hotcues) or
-            (cue.get('type') == CueType.LOAD.value and self.show_memory_cues) or
-            (cue.get('type') == CueType.LOOP.value and self.show_loops)
-        ))
+        points_count += idx - 1
+        QApplication.clipboard().setText("\n".join(lines) + "\n")
         
-        if self.track.grid_anchor_ms is not None and self.show_grid:
-            points_count += 1
-            
         QMessageBox.information(self, "Export Successful", 
                                f"Cue points data copied to clipboard.\n{points_count} points exported.")
\ No newline at end of file
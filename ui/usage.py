@@ -5,69 +5,19 @@ Displays comprehensive usage instructions and keyboard shortcuts
 
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QKeyEvent
+from PySide6.QtGui import QKeyEvent, QTextDocument
 
 
-class UsageDialog(QDialog):
-    """Dialog for displaying usage instructions and help."""
-    
-    def __init__(self, app_config, parent=None):
-        super().__init__(parent)
-        self.app_config = app_config
-        
-        self.setWindowTitle("Usage Guide")
-        self.resize(600, 500)
-        self.setModal(True)
-        
-        # Apply styling
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {app_config.COLORS['bg_dark']};
-                color: {app_config.COLORS['fg_light']};
-            }}
-            QTextEdit {{
-                background-color: {app_config.COLORS['bg_med']};
-                color: {app_config.COLORS['fg_light']};
-                border: none;
-                font-size: 10pt;
-            }}
-            QPushButton {{
-                background-color: {app_config.COLORS['bg_med']};
-                color: {app_config.COLORS['fg_light']};
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {app_config.COLORS['bg_light']};
-            }}
-        """)
-        
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        """Setup the usage dialog interface."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("USAGE GUIDE")
-        title.setStyleSheet("font-size: 18pt; font-weight: bold;")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Content
-        content = QTextEdit()
-        content.setReadOnly(True)
-        
-        usage_html = f"""
+# Guide content, formatted once per color palette
+_USAGE_HTML = """
         <style>
-            h3 {{ color: {self.app_config.COLORS['accent']}; margin-top: 20px; }}
+            h3 {{ color: {accent}; margin-top: 20px; }}
             table {{ border-collapse: collapse; width: 100%; margin: 10px 0; }}
-            th, td {{ border: 1px solid {self.app_config.COLORS['bg_light']}; padding: 8px; text-align: left; }}
-            th {{ background-color: {self.app_config.COLORS['bg_light']}; font-weight: bold; }}
+            th, td {{ border: 1px solid {bg_light}; padding: 8px; text-align: left; }}
+            th {{ background-color: {bg_light}; font-weight: bold; }}
             kbd {{ 
-                background-color: {self.app_config.COLORS['bg_light']}; 
-                color: {self.app_config.COLORS['fg_light']};
+                background-color: {bg_light}; 
+                color: {fg_light};
                 padding: 2px 6px; 
                 border-radius: 3px; 
                 font-family: monospace;
@@ -151,8 +101,63 @@ class UsageDialog(QDialog):
             <li><strong>Exit:</strong> Close application</li>
         </ul>
         """
+
+
+class UsageDialog(QDialog):
+    """Dialog for displaying usage instructions and help."""
+    
+    # Parsed guide documents shared between instances, keyed by palette
+    _doc_cache = {}
+    
+    def __init__(self, app_config, parent=None):
+        super().__init__(parent)
+        self.app_config = app_config
         
-        content.setHtml(usage_html)
+        self.setWindowTitle("Usage Guide")
+        self.resize(600, 500)
+        self.setModal(True)
+        
+        # Apply styling
+        self.setStyleSheet(f"""
+            QDialog {{
+                background-color: {app_config.COLORS['bg_dark']};
+                color: {app_config.COLORS['fg_light']};
+            }}
+            QTextEdit {{
+                background-color: {app_config.COLORS['bg_med']};
+                color: {app_config.COLORS['fg_light']};
+                border: none;
+                font-size: 10pt;
+            }}
+            QPushButton {{
+                background-color: {app_config.COLORS['bg_med']};
+                color: {app_config.COLORS['fg_light']};
+                border: none;
+                padding: 8px 16px;
+                border-radius: 4px;
+            }}
+            QPushButton:hover {{
+                background-color: {app_config.COLORS['bg_light']};
+            }}
+        """)
+        
+        self._setup_ui()
+    
+    def _setup_ui(self):
+        """Setup the usage dialog interface."""
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        # Title
+        title = QLabel("USAGE GUIDE")
+        title.setStyleSheet("font-size: 18pt; font-weight: bold;")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Content
+        content = QTextEdit()
+        content.setReadOnly(True)
+        
+        content.setDocument(self._usage_document(content))
         
         layout.addWidget(title)
         layout.addWidget(content)
@@ -169,6 +174,19 @@ class UsageDialog(QDialog):
         
         layout.addLayout(button_layout)
     
+    def _usage_document(self, parent: QTextEdit) -> QTextDocument:
+        """Return a copy of the cached guide document for the current color palette.
+        
+        Each dialog gets its own clone so layout and scroll state stay per view.
+        """
+        colors = tuple(self.app_config.COLORS.items())
+        document = self._doc_cache.get(colors)
+        if document is None:
+            document = QTextDocument()
+            document.setHtml(_USAGE_HTML.format(**self.app_config.COLORS))
+            self._doc_cache[colors] = document
+        return document.clone(parent)
+    
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard events."""
         if event.key() == Qt.Key.Key_Escape:
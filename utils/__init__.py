@@ -3,23 +3,47 @@ Utils package for Traktor Bridge
 Core utilities and helper modules
 """
 
-from .audio_manager import AudioManager
-from .db_manager import DatabaseManager, CipherManager
-from .key_translator import KeyTranslator
-from .loading_system import LoadingSystemMixin, LoadingThread
-from .path_validator import PathValidator
-from .playlist import Node, Track, PlaylistManager, PlaylistDetailsWindow
+import importlib
+
+# Public names are imported on first access (PEP 562) so that importing one
+# utility does not pull in pygame, sqlite and the Qt playlist window.
+_LAZY = {
+    'AudioManager': '.audio_manager',
+    'DatabaseManager': '.db_manager',
+    'CipherManager': '.db_manager',
+    'KeyTranslator': '.key_translator',
+    'LoadingSystemMixin': '.loading_system',
+    'LoadingThread': '.loading_system',
+    'PathValidator': '.path_validator',
+    'Node': '.playlist',
+    'Track': '.playlist',
+    'PlaylistManager': '.playlist',
+    'PlaylistDetailsWindow': '.playlist'
+}
 
 __all__ = [
     'AudioManager',
-    'DatabaseManager', 
+    'DatabaseManager',
     'CipherManager',
     'KeyTranslator',
     'LoadingSystemMixin',
-    'LoadingThread', 
+    'LoadingThread',
     'PathValidator',
     'Node',
     'Track',
     'PlaylistManager',
     'PlaylistDetailsWindow'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -23,8 +23,8 @@ class AudioManager:
     def __init__(self):
         self._lock = threading.RLock()
         self._initialized = False
-        self._current_file = None
-        self._playing_item_id = None
+        # (file, item_id), replaced as a whole so readers need no lock
+        self._state = (None, None)
         self._root_ref = None
         
     def initialize(self, root_widget=None) -> bool:
@@ -56,15 +56,17 @@ class AudioManager:
             
             try:
                 # Validate file
-                if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
+                try:
+                    if os.stat(file_path).st_size == 0:
+                        return False
+                except FileNotFoundError:
                     return False
                 
                 # Load and play
                 pygame.mixer.music.load(file_path)
                 pygame.mixer.music.play()
                 
-                self._current_file = file_path
-                self._playing_item_id = item_id
+                self._state = (file_path, item_id)
                 
                 return True
                 
@@ -80,22 +82,21 @@ class AudioManager:
     def _stop_internal(self):
         """Internal stop method (already in thread-safe context)."""
         try:
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
+            # stop() is a no-op when nothing is playing
+            pygame.mixer.music.stop()
         except:
             pass
         
-        self._current_file = None
-        self._playing_item_id = None
+        self._state = (None, None)
     
     def get_current_state(self) -> Dict[str, Any]:
-        """Return current state in thread-safe manner."""
-        with self._lock:
-            return {
-                'file': self._current_file,
-                'item_id': self._playing_item_id,
-                'is_playing': pygame.mixer.music.get_busy() if self._initialized else False
-            }
+        """Return current state from an atomic snapshot (no lock taken)."""
+        current_file, item_id = self._state
+        return {
+            'file': current_file,
+            'item_id': item_id,
+            'is_playing': pygame.mixer.music.get_busy() if self._initialized else False
+        }
     
     def is_available(self) -> bool:
         """Check if audio functionality is available."""
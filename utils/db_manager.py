@@ -4,6 +4,9 @@ Handles CDJ database creation and Cipher encryption support
 """
 
 import logging
+import os
+import queue
+import secrets
 import sqlite3
 import threading
 import time
@@ -11,6 +14,7 @@ import struct
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 
@@ -23,6 +27,414 @@ except ImportError:
     logging.warning("pysqlcipher3 not available. Using standard SQLite.")
 
 
+# Core tables for Rekordbox compatibility
+_TABLE_DEFINITIONS = {
+    'djmdContent': '''CREATE TABLE IF NOT EXISTS djmdContent (
+        ID INTEGER PRIMARY KEY, 
+        FolderPath TEXT, 
+        FileNameL TEXT, 
+        FileNameS TEXT,
+        Title TEXT, 
+        ArtistID INTEGER, 
+        AlbumID INTEGER, 
+        GenreID INTEGER, 
+        LabelID INTEGER, 
+        KeyID INTEGER,
+        ColorID INTEGER,
+        BPM REAL, 
+        Length INTEGER, 
+        BitRate INTEGER,
+        BitDepth INTEGER,
+        TrackNo INTEGER,
+        Rating INTEGER, 
+        FileType INTEGER,
+        Comment TEXT, 
+        AnalysisDataPath TEXT, 
+        FileSize INTEGER, 
+        SampleRate INTEGER,
+        Analysed INTEGER,
+        ReleaseDate TEXT,
+        DateCreated TEXT,
+        HotCueAutoLoad TEXT,
+        AutoGain REAL,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT,
+        ArtworkID INTEGER
+    )''',
+
+    'djmdPlaylist': '''CREATE TABLE IF NOT EXISTS djmdPlaylist (
+        ID INTEGER PRIMARY KEY,
+        Seq INTEGER,
+        Name TEXT,
+        ParentID INTEGER,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdSongPlaylist': '''CREATE TABLE IF NOT EXISTS djmdSongPlaylist (
+        ID INTEGER PRIMARY KEY,
+        PlaylistID INTEGER,
+        ContentID INTEGER,
+        TrackNo INTEGER,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdCue': '''CREATE TABLE IF NOT EXISTS djmdCue (
+        ID INTEGER PRIMARY KEY,
+        ContentID INTEGER,
+        InMsec INTEGER,
+        InFrame INTEGER,
+        InMpegFrame INTEGER,
+        InMpegAbs INTEGER,
+        OutMsec INTEGER,
+        OutFrame INTEGER,
+        OutMpegFrame INTEGER,
+        OutMpegAbs INTEGER,
+        Kind INTEGER,
+        Color INTEGER,
+        ActiveLoop INTEGER,
+        Comment TEXT,
+        BeatLoopSize INTEGER,
+        CueMicrosec INTEGER,
+        InPointSeekInfo TEXT,
+        OutPointSeekInfo TEXT,
+        ContentUUID TEXT,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdBeatGrid': '''CREATE TABLE IF NOT EXISTS djmdBeatGrid (
+        ID INTEGER PRIMARY KEY,
+        ContentID INTEGER,
+        BeatNo INTEGER,
+        Tempo REAL,
+        Position REAL,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdArtist': '''CREATE TABLE IF NOT EXISTS djmdArtist (
+        ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdAlbum': '''CREATE TABLE IF NOT EXISTS djmdAlbum (
+        ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        ArtistID INTEGER,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdGenre': '''CREATE TABLE IF NOT EXISTS djmdGenre (
+        ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdLabel': '''CREATE TABLE IF NOT EXISTS djmdLabel (
+        ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdKey': '''CREATE TABLE IF NOT EXISTS djmdKey (
+        ID INTEGER PRIMARY KEY,
+        ScaleName TEXT,
+        Seq INTEGER,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdColor': '''CREATE TABLE IF NOT EXISTS djmdColor (
+        ID INTEGER PRIMARY KEY,
+        Name TEXT,
+        ColorCode TEXT,
+        SortKey INTEGER,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdArtwork': '''CREATE TABLE IF NOT EXISTS djmdArtwork (
+        ID INTEGER PRIMARY KEY,
+        Path TEXT,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )''',
+
+    'djmdMixerParam': '''CREATE TABLE IF NOT EXISTS djmdMixerParam (
+        ID INTEGER PRIMARY KEY,
+        ContentID INTEGER,
+        GainHigh INTEGER,
+        GainLow INTEGER,
+        PeakHigh INTEGER,
+        PeakLow INTEGER,
+        UUID TEXT,
+        rb_data_status INTEGER,
+        rb_local_data_status INTEGER,
+        rb_local_deleted INTEGER,
+        rb_local_synced INTEGER,
+        usn INTEGER,
+        rb_local_usn INTEGER,
+        created_at TEXT,
+        updated_at TEXT
+    )'''
+}
+
+# Standard Rekordbox encryption key, passed raw so SQLCipher skips its KDF
+_REKORDBOX_KEY = "402fd482c38817c35ffa8ffb8c7d93143b749e7d315df7a81732a1ff43a3d643"
+_KEY_PRAGMA = f"PRAGMA key = \"x'{_REKORDBOX_KEY}'\""
+
+# All tables created in one script and one transaction
+_SCHEMA_SQL = "BEGIN;\n" + ";\n".join(_TABLE_DEFINITIONS.values()) + ";\nCOMMIT;"
+
+
+def _metadata_sql(table: str, name_column: str) -> Dict[str, str]:
+    """Build the lookup, MAX(ID) and insert statements for one metadata table."""
+    if table == 'djmdKey':
+        insert = (f"INSERT INTO {table} (ID, ScaleName, Seq, UUID, rb_data_status, created_at, updated_at) "
+                  "VALUES (?, ?, ?, ?, 0, ?, ?)")
+    else:
+        insert = (f"INSERT INTO {table} (ID, Name, UUID, rb_data_status, created_at, updated_at) "
+                  "VALUES (?, ?, ?, 0, ?, ?)")
+    return {
+        'select': f"SELECT ID FROM {table} WHERE {name_column} = ?",
+        'max': f"SELECT MAX(ID) FROM {table}",
+        'insert': insert
+    }
+
+
+# Statements used by get_or_create_id, generated once per metadata table
+_METADATA_SQL = {
+    'djmdArtist': _metadata_sql('djmdArtist', 'Name'),
+    'djmdAlbum': _metadata_sql('djmdAlbum', 'Name'),
+    'djmdGenre': _metadata_sql('djmdGenre', 'Name'),
+    'djmdLabel': _metadata_sql('djmdLabel', 'Name'),
+    'djmdKey': _metadata_sql('djmdKey', 'ScaleName')
+}
+
+
+class _UUIDPool:
+    """Random (version 4) UUID strings served from one bulk urandom read."""
+    
+    def __init__(self, n: int = 16384):
+        self._size = 16 * n
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+    
+    def next(self) -> str:
+        with self._lock:
+            if self._pos >= len(self._buf):
+                self._buf = secrets.token_bytes(self._size)
+                self._pos = 0
+            raw = self._buf[self._pos:self._pos + 16]
+            self._pos += 16
+        return str(uuid.UUID(bytes=raw, version=4))
+    
+    def take(self, count: int) -> List[str]:
+        return [self.next() for _ in range(count)]
+    
+    def reset(self):
+        """Discard buffered bytes (a forked child must not reuse the parent's)."""
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+
+_uuid_pool = _UUIDPool()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_uuid_pool.reset)
+
+
+class _ConnectionPool:
+    """One shared writer connection plus a small pool of reader connections.
+    
+    Readers rely on WAL snapshots, so they never wait for the writer.
+    """
+    
+    def __init__(self, connect, n_readers: int = 4):
+        self._connect = connect
+        self._n_readers = n_readers
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        self._readers: queue.SimpleQueue = queue.SimpleQueue()
+        self._reader_count = 0
+        # Connections opened since the last close(); anything else is stale
+        self._live = set()
+        self._open_lock = threading.Lock()
+    
+    @contextmanager
+    def acquire_writer(self):
+        """Hold the writer connection for the duration of the block."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._open()
+            yield self._writer
+    
+    @contextmanager
+    def acquire_reader(self):
+        """Borrow an idle reader connection, opening one if below the limit."""
+        conn = self._take_reader()
+        try:
+            yield conn
+        finally:
+            with self._open_lock:
+                live = conn in self._live
+            # A connection closed by close() while borrowed is not pooled again
+            if live:
+                self._readers.put(conn)
+    
+    def _take_reader(self):
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                with self._open_lock:
+                    can_open = self._reader_count < self._n_readers
+                    if can_open:
+                        self._reader_count += 1
+                if can_open:
+                    conn = None
+                    try:
+                        conn = self._open()
+                        conn.execute("PRAGMA query_only=1")
+                    except Exception:
+                        self._discard_reader(conn)
+                        raise
+                    return conn
+                try:
+                    # Time out to re-check the limit, which close() resets
+                    conn = self._readers.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            with self._open_lock:
+                if conn in self._live:
+                    return conn
+    
+    def _discard_reader(self, conn):
+        with self._open_lock:
+            self._reader_count -= 1
+            self._live.discard(conn)
+        if conn is not None:
+            try:
+                conn.close()
+            except:
+                pass
+    
+    def _open(self):
+        conn = self._connect()
+        with self._open_lock:
+            self._live.add(conn)
+        return conn
+    
+    def close(self):
+        """Close every connection opened by the pool."""
+        with self._writer_lock, self._open_lock:
+            for conn in self._live:
+                try:
+                    conn.close()
+                except:
+                    pass
+            self._live.clear()
+            self._reader_count = 0
+            self._writer = None
+            while True:
+                try:
+                    self._readers.get_nowait()
+                except queue.Empty:
+                    break
+
+
 class DatabaseManager:
     """Database manager with SQLCipher support for CDJ compatibility."""
     
@@ -32,328 +444,132 @@ class DatabaseManager:
         self.use_encryption = use_encryption and SQLCIPHER_AVAILABLE
         
         # Standard Rekordbox encryption key
-        self.encryption_key = "402fd482c38817c35ffa8ffb8c7d93143b749e7d315df7a81732a1ff43a3d643"
+        self.encryption_key = _REKORDBOX_KEY
         
-    @contextmanager
-    def get_connection(self, max_retries: int = 3):
-        """Context manager with SQLCipher support and retry logic."""
-        conn = None
+        # Long-lived connections, keyed and configured once
+        self._pool = _ConnectionPool(self._open_connection)
         
-        for attempt in range(max_retries):
-            try:
-                if self.use_encryption:
-                    conn = sqlcipher.connect(
-                        str(self.db_path),
-                        timeout=30,
-                        isolation_level=None
-                    )
-                    conn.execute(f"PRAGMA key = \"x'{self.encryption_key}'\"")
-                    conn.execute("PRAGMA cipher_compatibility = 3")
-                else:
-                    conn = sqlite3.connect(
-                        str(self.db_path),
-                        timeout=30,
-                        isolation_level=None
-                    )
-                
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-                break
-                
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    time.sleep(0.1 * (attempt + 1))
-                    continue
-                else:
-                    raise sqlite3.Error(f"Failed to connect after {max_retries} attempts: {e}")
+        self._sql = _METADATA_SQL
         
+        # Highest ID handed out per metadata table, seeded from MAX(ID) once
+        self._max_ids: Dict[str, int] = {}
+        
+        # Timestamp text shared by all inserts within the same second
+        self._now_second = 0
+        self._now_text = ""
+    
+    def _open_connection(self):
+        """Open and configure a new database connection."""
+        # timeout=30 is SQLite's own busy handler, no Python retry loop needed
+        conn = None
         try:
-            yield conn
-        except Exception:
+            if self.use_encryption:
+                conn = sqlcipher.connect(
+                    str(self.db_path),
+                    timeout=30,
+                    detect_types=0,
+                    isolation_level=None,
+                    check_same_thread=False,
+                    cached_statements=256
+                )
+                conn.execute(_KEY_PRAGMA)
+                conn.execute("PRAGMA cipher_compatibility = 3")
+                # Process-local: skips scrubbing freed memory, file format unchanged
+                conn.execute("PRAGMA cipher_memory_security = OFF")
+            else:
+                conn = sqlite3.connect(
+                    str(self.db_path),
+                    timeout=30,
+                    detect_types=0,
+                    isolation_level=None,
+                    check_same_thread=False,
+                    cached_statements=256
+                )
+            
+            # Plain tuples, no converters: the schema has no custom types
+            conn.row_factory = None
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Read-heavy cache warmup: mapped pages, 64 MB page cache
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            
+        except Exception as e:
             if conn:
                 try:
-                    conn.rollback()
+                    conn.close()
                 except:
                     pass
-            raise
-        finally:
-            if conn:
+            raise sqlite3.Error(f"Failed to connect: {e}")
+        
+        return conn
+    
+    @contextmanager
+    def get_connection(self):
+        """Context manager holding the shared writer connection."""
+        with self._pool.acquire_writer() as conn:
+            try:
+                yield conn
+            except Exception:
                 try:
-                    conn.close()
+                    conn.rollback()
                 except:
                     pass
+                raise
+    
+    @contextmanager
+    def _transaction(self, conn):
+        """Run the enclosed statements in one explicit transaction."""
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    
+    def close(self):
+        """Close every connection opened by this manager."""
+        self._pool.close()
     
     def execute_batch(self, query: str, data_batch: List[tuple], batch_size: int = 100):
         """Execute batch operations with validation."""
         if not data_batch:
             return
             
-        with self._lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                for i in range(0, len(data_batch), batch_size):
-                    batch = data_batch[i:i + batch_size]
-                    try:
-                        cursor.executemany(query, batch)
-                    except sqlite3.Error as e:
-                        logging.error(f"Batch execution failed at batch {i//batch_size}: {e}")
-                        continue
+        with self.get_connection() as conn, self._transaction(conn):
+            # Rows may be inserted with explicit IDs, reseed the allocator afterwards
+            with self._lock:
+                self._max_ids.clear()
+            cursor = conn.cursor()
+            rows = iter(data_batch)
+            
+            chunks = iter(lambda: list(islice(rows, batch_size)), [])
+            
+            for batch_index, batch in enumerate(chunks):
+                try:
+                    cursor.executemany(query, batch)
+                except sqlite3.Error as e:
+                    logging.error(f"Batch execution failed at batch {batch_index}: {e}")
+                    continue
     
     def create_database_structure(self):
         """Initialize SQLite database with all required Rekordbox tables."""
+        self._max_ids.clear()
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Core tables for Rekordbox compatibility
-            table_definitions = {
-                'djmdContent': '''CREATE TABLE IF NOT EXISTS djmdContent (
-                    ID INTEGER PRIMARY KEY, 
-                    FolderPath TEXT, 
-                    FileNameL TEXT, 
-                    FileNameS TEXT,
-                    Title TEXT, 
-                    ArtistID INTEGER, 
-                    AlbumID INTEGER, 
-                    GenreID INTEGER, 
-                    LabelID INTEGER, 
-                    KeyID INTEGER,
-                    ColorID INTEGER,
-                    BPM REAL, 
-                    Length INTEGER, 
-                    BitRate INTEGER,
-                    BitDepth INTEGER,
-                    TrackNo INTEGER,
-                    Rating INTEGER, 
-                    FileType INTEGER,
-                    Comment TEXT, 
-                    AnalysisDataPath TEXT, 
-                    FileSize INTEGER, 
-                    SampleRate INTEGER,
-                    Analysed INTEGER,
-                    ReleaseDate TEXT,
-                    DateCreated TEXT,
-                    HotCueAutoLoad TEXT,
-                    AutoGain REAL,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT,
-                    ArtworkID INTEGER
-                )''',
-                
-                'djmdPlaylist': '''CREATE TABLE IF NOT EXISTS djmdPlaylist (
-                    ID INTEGER PRIMARY KEY,
-                    Seq INTEGER,
-                    Name TEXT,
-                    ParentID INTEGER,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdSongPlaylist': '''CREATE TABLE IF NOT EXISTS djmdSongPlaylist (
-                    ID INTEGER PRIMARY KEY,
-                    PlaylistID INTEGER,
-                    ContentID INTEGER,
-                    TrackNo INTEGER,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdCue': '''CREATE TABLE IF NOT EXISTS djmdCue (
-                    ID INTEGER PRIMARY KEY,
-                    ContentID INTEGER,
-                    InMsec INTEGER,
-                    InFrame INTEGER,
-                    InMpegFrame INTEGER,
-                    InMpegAbs INTEGER,
-                    OutMsec INTEGER,
-                    OutFrame INTEGER,
-                    OutMpegFrame INTEGER,
-                    OutMpegAbs INTEGER,
-                    Kind INTEGER,
-                    Color INTEGER,
-                    ActiveLoop INTEGER,
-                    Comment TEXT,
-                    BeatLoopSize INTEGER,
-                    CueMicrosec INTEGER,
-                    InPointSeekInfo TEXT,
-                    OutPointSeekInfo TEXT,
-                    ContentUUID TEXT,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdBeatGrid': '''CREATE TABLE IF NOT EXISTS djmdBeatGrid (
-                    ID INTEGER PRIMARY KEY,
-                    ContentID INTEGER,
-                    BeatNo INTEGER,
-                    Tempo REAL,
-                    Position REAL,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdArtist': '''CREATE TABLE IF NOT EXISTS djmdArtist (
-                    ID INTEGER PRIMARY KEY,
-                    Name TEXT,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdAlbum': '''CREATE TABLE IF NOT EXISTS djmdAlbum (
-                    ID INTEGER PRIMARY KEY,
-                    Name TEXT,
-                    ArtistID INTEGER,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdGenre': '''CREATE TABLE IF NOT EXISTS djmdGenre (
-                    ID INTEGER PRIMARY KEY,
-                    Name TEXT,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdLabel': '''CREATE TABLE IF NOT EXISTS djmdLabel (
-                    ID INTEGER PRIMARY KEY,
-                    Name TEXT,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdKey': '''CREATE TABLE IF NOT EXISTS djmdKey (
-                    ID INTEGER PRIMARY KEY,
-                    ScaleName TEXT,
-                    Seq INTEGER,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdColor': '''CREATE TABLE IF NOT EXISTS djmdColor (
-                    ID INTEGER PRIMARY KEY,
-                    Name TEXT,
-                    ColorCode TEXT,
-                    SortKey INTEGER,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
-                
-                'djmdArtwork': '''CREATE TABLE IF NOT EXISTS djmdArtwork (
-                    ID INTEGER PRIMARY KEY,
-                    Path TEXT,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )''',
+            # Initial build is rerun on failure, so skip fsyncs until it is done
+            conn.execute("PRAGMA synchronous=OFF")
+            try:
+                # Create all tables (executescript commits any open transaction first)
+                conn.executescript(_SCHEMA_SQL)
                 
-                'djmdMixerParam': '''CREATE TABLE IF NOT EXISTS djmdMixerParam (
-                    ID INTEGER PRIMARY KEY,
-                    ContentID INTEGER,
-                    GainHigh INTEGER,
-                    GainLow INTEGER,
-                    PeakHigh INTEGER,
-                    PeakLow INTEGER,
-                    UUID TEXT,
-                    rb_data_status INTEGER,
-                    rb_local_data_status INTEGER,
-                    rb_local_deleted INTEGER,
-                    rb_local_synced INTEGER,
-                    usn INTEGER,
-                    rb_local_usn INTEGER,
-                    created_at TEXT,
-                    updated_at TEXT
-                )'''
-            }
-            
-            # Create all tables
-            for table_name, table_sql in table_definitions.items():
-                cursor.execute(table_sql)
-            
-            # Populate default values
-            self._populate_default_values(cursor)
+                # Populate default values
+                with self._transaction(conn):
+                    self._populate_default_values(conn.cursor())
+            finally:
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     
     def _populate_default_values(self, cursor: sqlite3.Cursor):
         """Add default values for reference tables."""
@@ -372,11 +588,11 @@ class DatabaseManager:
         ]
         
         cursor.execute("DELETE FROM djmdColor")
-        for color_id, name, code, sort_key in colors:
-            cursor.execute("""
-                INSERT INTO djmdColor (ID, Name, ColorCode, SortKey, UUID, rb_data_status, created_at, updated_at) 
-                VALUES (?, ?, ?, ?, ?, 0, ?, ?)
-            """, (color_id, name, code, sort_key, str(uuid.uuid4()), current_time, current_time))
+        cursor.executemany("""
+            INSERT INTO djmdColor (ID, Name, ColorCode, SortKey, UUID, rb_data_status, created_at, updated_at) 
+            VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+        """, [(color_id, name, code, sort_key, uuid_str, current_time, current_time)
+              for (color_id, name, code, sort_key), uuid_str in zip(colors, _uuid_pool.take(len(colors)))])
         
         # Musical keys (Camelot + Traditional)
         keys = [
@@ -389,25 +605,40 @@ class DatabaseManager:
         ]
         
         cursor.execute("DELETE FROM djmdKey")
-        for key_id, scale_name, seq in keys:
-            cursor.execute("""
-                INSERT INTO djmdKey (ID, ScaleName, Seq, UUID, rb_data_status, created_at, updated_at)
-                VALUES (?, ?, ?, ?, 0, ?, ?)
-            """, (key_id, scale_name, seq, str(uuid.uuid4()), current_time, current_time))
+        cursor.executemany("""
+            INSERT INTO djmdKey (ID, ScaleName, Seq, UUID, rb_data_status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, 0, ?, ?)
+        """, [(key_id, scale_name, seq, uuid_str, current_time, current_time)
+              for (key_id, scale_name, seq), uuid_str in zip(keys, _uuid_pool.take(len(keys)))])
     
     def build_lookup_caches(self) -> Dict[str, Dict[str, int]]:
         """Pre-load existing database entries for performance."""
-        with self.get_connection() as conn:
+        with self._pool.acquire_reader() as conn:
             cursor = conn.cursor()
             
-            return {
-                'artists': {row[1]: row[0] for row in cursor.execute("SELECT ID, Name FROM djmdArtist")},
-                'albums': {row[1]: row[0] for row in cursor.execute("SELECT ID, Name FROM djmdAlbum")},
-                'genres': {row[1]: row[0] for row in cursor.execute("SELECT ID, Name FROM djmdGenre")},
-                'labels': {row[1]: row[0] for row in cursor.execute("SELECT ID, Name FROM djmdLabel")},
-                'keys': {row[1]: row[0] for row in cursor.execute("SELECT ID, ScaleName FROM djmdKey")},
-                'content': {row[1]: row[0] for row in cursor.execute("SELECT ID, FileNameL FROM djmdContent")}
-            }
+            # The reader snapshot misses rows the writer has not committed
+            # yet, so never move a counter backwards
+            with self._lock:
+                for table, sql in self._sql.items():
+                    cursor.execute(sql['max'])
+                    snapshot_max = cursor.fetchone()[0] or 0
+                    self._max_ids[table] = max(self._max_ids.get(table, 0), snapshot_max)
+            
+            # Name first so fetchall() rows feed dict() directly
+            cursor.arraysize = 4096
+            caches = {}
+            for cache_name, query in (
+                ('artists', "SELECT Name, ID FROM djmdArtist"),
+                ('albums', "SELECT Name, ID FROM djmdAlbum"),
+                ('genres', "SELECT Name, ID FROM djmdGenre"),
+                ('labels', "SELECT Name, ID FROM djmdLabel"),
+                ('keys', "SELECT ScaleName, ID FROM djmdKey"),
+                ('content', "SELECT FileNameL, ID FROM djmdContent")
+            ):
+                cursor.execute(query)
+                caches[cache_name] = dict(cursor.fetchall())
+            
+            return caches
     
     def get_or_create_id(self, cursor: sqlite3.Cursor, table: str, name: str, cache: Dict[str, int]) -> Optional[int]:
         """Get ID for metadata item from cache or create new entry."""
@@ -417,11 +648,10 @@ class DatabaseManager:
         if name in cache:
             return cache[name]
         
+        sql = self._sql[table]
+        
         # Check database first
-        if table == 'djmdKey':
-            cursor.execute(f"SELECT ID FROM {table} WHERE ScaleName = ?", (name,))
-        else:
-            cursor.execute(f"SELECT ID FROM {table} WHERE Name = ?", (name,))
+        cursor.execute(sql['select'], (name,))
         
         result = cursor.fetchone()
         if result:
@@ -429,26 +659,36 @@ class DatabaseManager:
             return result[0]
         
         # Create new entry
-        cursor.execute(f"SELECT MAX(ID) FROM {table}")
-        max_id = cursor.fetchone()[0] or 0
-        new_id = max_id + 1
+        new_id = self._next_id(cursor, table)
         
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        uuid_str = str(uuid.uuid4())
+        current_time = self._now_str()
+        uuid_str = _uuid_pool.next()
         
         if table == 'djmdKey':
-            cursor.execute(f"""
-                INSERT INTO {table} (ID, ScaleName, Seq, UUID, rb_data_status, created_at, updated_at) 
-                VALUES (?, ?, ?, ?, 0, ?, ?)
-            """, (new_id, name, new_id, uuid_str, current_time, current_time))
+            cursor.execute(sql['insert'], (new_id, name, new_id, uuid_str, current_time, current_time))
         else:
-            cursor.execute(f"""
-                INSERT INTO {table} (ID, Name, UUID, rb_data_status, created_at, updated_at) 
-                VALUES (?, ?, ?, 0, ?, ?)
-            """, (new_id, name, uuid_str, current_time, current_time))
+            cursor.execute(sql['insert'], (new_id, name, uuid_str, current_time, current_time))
         
         cache[name] = new_id
         return new_id
+    
+    def _now_str(self) -> str:
+        """Return the current timestamp text, formatted once per second."""
+        now = int(time.time())
+        if now != self._now_second:
+            self._now_second = now
+            self._now_text = datetime.fromtimestamp(now).strftime('%Y-%m-%d %H:%M:%S')
+        return self._now_text
+    
+    def _next_id(self, cursor: sqlite3.Cursor, table: str) -> int:
+        """Allocate the next ID for a metadata table without a MAX(ID) query per insert."""
+        with self._lock:
+            max_id = self._max_ids.get(table)
+            if max_id is None:
+                cursor.execute(self._sql[table]['max'])
+                max_id = cursor.fetchone()[0] or 0
+            self._max_ids[table] = max_id + 1
+            return max_id + 1
 
 
 class CipherManager:
@@ -468,8 +708,8 @@ class CipherManager:
         try:
             conn = sqlcipher.connect(db_path)
             conn.execute(f"PRAGMA key = \"x'{encryption_key}'\"")
-            conn.execute("CREATE TABLE test_table (id INTEGER)")
-            conn.execute("DROP TABLE test_table")
+            # Reading the schema decrypts page 1 without a write transaction
+            conn.execute("SELECT count(*) FROM sqlite_master").fetchone()
             conn.close()
             return True
         except Exception as e:
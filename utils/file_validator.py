@@ -5,6 +5,7 @@ Validates audio file integrity before processing
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -14,13 +15,129 @@ try:
 except ImportError:
     MUTAGEN_AVAILABLE = False
 
+# Layer III bitrates in kbps by header bitrate index (MPEG-1, then MPEG-2/2.5)
+_BITRATES_V1_L3 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, None)
+_BITRATES_V2_L3 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, None)
+
+# Layer III sample rates in Hz by header version bits (index 3 is reserved)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000)    # MPEG-2.5
+}
+
+# Bytes searched for the first frame after the ID3v2 tag (covers tag padding)
+_FRAME_SCAN_SIZE = 4096
+
+# Longest Layer III frame (MPEG-2.5 at 160 kbps, 8 kHz, padded), read past
+# the search window so a frame found near its end can be confirmed
+_MAX_FRAME_LENGTH = 1441
+
+
+def _parse_frame_header(data: bytes, pos: int) -> Optional[tuple]:
+    """Return (version, bitrate_bps, frame_length) for a Layer III header at pos."""
+    if pos + 4 > len(data) or data[pos] != 0xFF:
+        return None
+    b1, b2 = data[pos + 1], data[pos + 2]
+    version = (b1 >> 3) & 0x03
+    layer = (b1 >> 1) & 0x03
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if (b1 & 0xE0 != 0xE0 or version == 1 or layer != 1
+            or bitrate_index in (0, 15) or rate_index == 3):
+        return None
+    
+    table = _BITRATES_V1_L3 if version == 3 else _BITRATES_V2_L3
+    bitrate = table[bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+    frame_length = (144 if version == 3 else 72) * bitrate // sample_rate + padding
+    return version, bitrate, frame_length
+
+
+def _first_frame_bitrate(data: bytes) -> Optional[int]:
+    """Return the bitrate (bps) of the first MPEG Layer III frame in data.
+    
+    Sync words are searched in the first _FRAME_SCAN_SIZE bytes; a candidate
+    only counts when a second frame with the same version follows it, so
+    stray 0xFF bytes in padding or junk are skipped.
+    """
+    pos = data.find(b'\xff', 0, _FRAME_SCAN_SIZE)
+    while pos != -1:
+        first = _parse_frame_header(data, pos)
+        if first is not None:
+            version, bitrate, frame_length = first
+            second = _parse_frame_header(data, pos + frame_length)
+            if second is not None and second[0] == version:
+                return bitrate
+        pos = data.find(b'\xff', pos + 1, _FRAME_SCAN_SIZE)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _validate_mp3_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Validate MP3 file integrity; mtime and size only key the cache.
+    
+    Parse and I/O errors propagate so that they are never memoized.
+    """
+    result = {
+        'valid': False,
+        'error': None,
+        'duration': 0,
+        'bitrate': 0
+    }
+    
+    if size == 0:
+        result['error'] = "Empty file"
+        return result
+    
+    if MUTAGEN_AVAILABLE:
+        from mutagen.mp3 import MP3
+        audio = MP3(file_path)
+        result['duration'] = audio.info.length
+        result['bitrate'] = audio.info.bitrate
+        result['valid'] = True
+    else:
+        # Basic validation without mutagen
+        with open(file_path, 'rb') as f:
+            header = f.read(10)
+            if header.startswith(b'ID3') or header[0:2] == b'\xff\xfb':
+                result['valid'] = True
+            else:
+                result['error'] = "Invalid MP3 header"
+    
+    return result
+
 
 class AudioFileValidator:
     """Validates audio file integrity and format."""
     
     @staticmethod
     def validate_mp3(file_path: str) -> Dict[str, Any]:
-        """Validate MP3 file integrity."""
+        """Validate MP3 file integrity (memoized on path, mtime and size)."""
+        try:
+            abs_path = os.path.abspath(file_path)
+            st = os.stat(abs_path)
+        except FileNotFoundError:
+            return {'valid': False, 'error': "File not found", 'duration': 0, 'bitrate': 0}
+        except OSError as e:
+            logging.warning(f"MP3 validation failed for {file_path}: {e}")
+            return {'valid': False, 'error': str(e), 'duration': 0, 'bitrate': 0}
+        
+        try:
+            # Copy so callers cannot mutate the cached entry
+            return dict(_validate_mp3_cached(abs_path, st.st_mtime_ns, st.st_size))
+        except Exception as e:
+            # Not cached: the error may be transient (network or USB volume)
+            logging.warning(f"MP3 validation failed for {file_path}: {e}")
+            return {'valid': False, 'error': str(e), 'duration': 0, 'bitrate': 0}
+    
+    @staticmethod
+    def validate_mp3_fast(file_path: str) -> Dict[str, Any]:
+        """Validate MP3 file from its first frame header, without a full mutagen parse.
+        
+        Duration is not computed; use validate_mp3 when it is needed.
+        """
         result = {
             'valid': False,
             'error': None,
@@ -29,31 +146,34 @@ class AudioFileValidator:
         }
         
         try:
-            if not os.path.exists(file_path):
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 result['error'] = "File not found"
                 return result
             
-            if os.path.getsize(file_path) == 0:
+            if st.st_size == 0:
                 result['error'] = "Empty file"
                 return result
             
-            if MUTAGEN_AVAILABLE:
-                from mutagen.mp3 import MP3
-                audio = MP3(file_path)
-                result['duration'] = audio.info.length
-                result['bitrate'] = audio.info.bitrate
-                result['valid'] = True
+            with open(file_path, 'rb') as f:
+                header = f.read(10)
+                offset = 0
+                if len(header) == 10 and header.startswith(b'ID3'):
+                    # ID3v2 size is syncsafe (7 bits per byte), plus optional footer
+                    tag_size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+                    offset = 10 + tag_size + (10 if header[5] & 0x10 else 0)
+                f.seek(offset)
+                bitrate = _first_frame_bitrate(f.read(_FRAME_SCAN_SIZE + _MAX_FRAME_LENGTH))
+            
+            if bitrate is None:
+                result['error'] = "No MPEG audio frame found"
             else:
-                # Basic validation without mutagen
-                with open(file_path, 'rb') as f:
-                    header = f.read(10)
-                    if header.startswith(b'ID3') or header[0:2] == b'\xff\xfb':
-                        result['valid'] = True
-                    else:
-                        result['error'] = "Invalid MP3 header"
+                result['bitrate'] = bitrate
+                result['valid'] = True
             
         except Exception as e:
             result['error'] = str(e)
             logging.warning(f"MP3 validation failed for {file_path}: {e}")
         
-        return result
\ No newline at end of file
+        return result